@@ -0,0 +1,3 @@
+"""
+Ferramentas de medição de desempenho da suíte (benchmarks e geração de carga).
+"""
@@ -0,0 +1,136 @@
+"""
+Micro-benchmark da detecção de mensagens de erro.
+Compara o helper original (um comando do WebDriver por seletor, elemento e
+palavra-chave) com o detector em lote (um único `execute_script`), medindo
+número de comandos e latência em páginas sintéticas.
+
+Uso:
+    python -m perf.bench_error_detector [--repeat 20] [--json resultado.json]
+"""
+import argparse
+import json
+import statistics
+import time
+import urllib.parse
+from contextlib import contextmanager
+
+from selenium.webdriver.common.by import By
+
+from tests.conftest import create_chrome_driver
+from tests.support.errors import ERROR_KEYWORDS, ERROR_SELECTORS, find_error_message
+
+
+_FORM = """
+<form>
+  <input id="email" type="email" required>
+  <input id="password" type="password" required>
+  <span class="error"></span><span class="error-message" style="display:none">x</span>
+  <div class="field-error"></div><p class="hint-error"></p>
+  <button type="submit">Entrar</button>
+</form>
+"""
+
+# Páginas sintéticas: sem erro (pior caso do helper original), erro com
+# classe CSS e erro identificado apenas por palavra-chave
+SCENARIOS = {
+    "sem_erro": _FORM,
+    "erro_com_classe": _FORM + '<div class="alert alert-danger" role="alert">Credenciais inválidas</div>',
+    "erro_por_palavra_chave": _FORM + "<p>O login falhou: usuário não autorizado</p>",
+}
+
+
+def legacy_find_error_message(driver):
+    """Implementação original do helper `_find_error_message`, mantida para comparação."""
+    for selector in ERROR_SELECTORS:
+        try:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                for element in elements:
+                    if element.is_displayed() and element.text.strip():
+                        return True
+        except:
+            continue
+
+    try:
+        body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
+        if any(keyword in body_text for keyword in ERROR_KEYWORDS):
+            for keyword in ERROR_KEYWORDS:
+                try:
+                    elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{keyword}')]")
+                    for element in elements:
+                        if element.is_displayed() and element.text.strip():
+                            return True
+                except:
+                    continue
+    except:
+        pass
+
+    return False
+
+
+@contextmanager
+def count_commands(driver):
+    """Conta os comandos enviados ao chromedriver (uma ida e volta HTTP cada)."""
+    executor = driver.command_executor
+    original = executor.execute
+    counter = {"commands": 0}
+
+    def execute(command, params):
+        counter["commands"] += 1
+        return original(command, params)
+
+    executor.execute = execute
+    try:
+        yield counter
+    finally:
+        executor.execute = original
+
+
+def measure(driver, detector, repeat):
+    """Executa o detector `repeat` vezes e retorna comandos por chamada e latências (ms)."""
+    latencies = []
+    with count_commands(driver) as counter:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            detector(driver)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return counter["commands"] / repeat, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Execuções por detector e cenário.")
+    parser.add_argument("--json", help="Arquivo para gravar os resultados em JSON.")
+    args = parser.parse_args()
+
+    driver = create_chrome_driver()
+    results = {}
+    try:
+        for name, html in SCENARIOS.items():
+            driver.get("data:text/html;charset=utf-8," + urllib.parse.quote(html))
+            results[name] = {}
+            for label, detector in (("original", legacy_find_error_message), ("lote", find_error_message)):
+                detector(driver)  # aquecimento
+                commands, latencies = measure(driver, detector, args.repeat)
+                results[name][label] = {
+                    "commands": commands,
+                    "median_ms": statistics.median(latencies),
+                    "p95_ms": sorted(latencies)[int(0.95 * (len(latencies) - 1))],
+                }
+    finally:
+        driver.quit()
+
+    print(f"{'cenário':<24}{'detector':<10}{'comandos':>10}{'mediana (ms)':>14}{'p95 (ms)':>10}")
+    for name, by_detector in results.items():
+        for label, data in by_detector.items():
+            print(f"{name:<24}{label:<10}{data['commands']:>10.1f}{data['median_ms']:>14.2f}{data['p95_ms']:>10.2f}")
+        speedup = by_detector["original"]["median_ms"] / max(by_detector["lote"]["median_ms"], 1e-6)
+        print(f"{'':<24}{'ganho':<10}{'':>10}{speedup:>13.1f}x")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark da inicialização do Chrome usado pela fixture `driver`.
+Mede o tempo até a sessão estar pronta (criação do driver + primeira
+navegação para about:blank) em três situações:
+
+- padrao: modo headless com perfil novo em disco;
+- rapido_frio: modo de inicialização rápida sem perfil-modelo (inclui o pré-aquecimento);
+- rapido_quente: modo de inicialização rápida reaproveitando o perfil-modelo.
+
+Com --history os resultados são acrescentados a um JSONL junto com a versão do
+Chrome, permitindo acompanhar a evolução entre atualizações do navegador.
+
+Uso:
+    python -m perf.bench_startup [--repeat 5] [--history perf/startup_history.jsonl]
+"""
+import argparse
+import json
+import shutil
+import statistics
+import time
+from datetime import datetime, timezone
+
+from tests.conftest import create_chrome_driver
+from tests.support.profile import profile_template_dir
+
+
+def launch(**kwargs):
+    """Inicia uma sessão, aguarda estar pronta e retorna (tempo em ms, versão do Chrome)."""
+    start = time.perf_counter()
+    driver = create_chrome_driver(**kwargs)
+    try:
+        driver.get("about:blank")
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, driver.capabilities.get("browserVersion")
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Inicializações medidas por situação.")
+    parser.add_argument("--history", help="Arquivo JSONL onde o resultado é acrescentado.")
+    args = parser.parse_args()
+
+    results = {"padrao": [], "rapido_frio": [], "rapido_quente": []}
+    version = None
+    for _ in range(args.repeat):
+        elapsed, version = launch(headless=True)
+        results["padrao"].append(elapsed)
+
+        shutil.rmtree(profile_template_dir(), ignore_errors=True)
+        elapsed, _ = launch(fast_startup=True)
+        results["rapido_frio"].append(elapsed)
+
+        elapsed, _ = launch(fast_startup=True)
+        results["rapido_quente"].append(elapsed)
+
+    summary = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "chrome_version": version,
+        "repeat": args.repeat,
+        "median_ms": {name: round(statistics.median(values), 1) for name, values in results.items()},
+        "min_ms": {name: round(min(values), 1) for name, values in results.items()},
+    }
+
+    print(f"Chrome {version}")
+    print(f"{'situação':<16}{'mediana (ms)':>14}{'mínimo (ms)':>14}")
+    for name in results:
+        print(f"{name:<16}{summary['median_ms'][name]:>14.1f}{summary['min_ms'][name]:>14.1f}")
+
+    if args.history:
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Benchmarks da própria suíte, com linhas de base versionadas e detecção de regressões.
+Cada cenário reproduz uma etapa dos testes de login contra o servidor local
+simulado (ou --base-url), usando os mesmos helpers de `TestLogin`:
+
+- inicializacao: criação do driver até a sessão estar pronta (about:blank);
+- navegacao: `_navigate_to_login` (página carregada e campo de email localizado);
+- preenchimento: `_fill_email` + `_fill_password`;
+- deteccao_erro: `_find_error_message` com a mensagem de erro já exibida;
+- teste_completo: login válido de ponta a ponta até o painel;
+- sessao_restaurada: chegada ao painel pelo estado autenticado reaproveitado
+  (snapshot de cookies e armazenamento, sem o login pela interface).
+
+As amostras são gravadas em uma linha de base JSON (perf/baselines/) que deve
+ser versionada junto com o código. Em uma nova execução, cada cenário é
+comparado com a linha de base pela razão das medianas e seu intervalo de
+confiança por bootstrap: há regressão quando todo o intervalo fica acima de
+1 + --threshold, ou seja, a piora é estatisticamente consistente e maior que
+a tolerância. O código de saída é 1 se algum cenário regrediu.
+
+Uso:
+    python -m perf.bench_suite --update-baseline
+    python -m perf.bench_suite [--repeat 15] [--baseline perf/baselines/local.json] [--threshold 0.10]
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.conftest import VALID_CREDENTIALS, create_chrome_driver
+from tests.support.auth import AuthState
+from tests.support.fake_app import FakeLoginApp
+from tests.support.input_modes import INPUT_MODES, KEYSTROKE
+from tests.support.pool import DriverPool
+from tests.test_login import TestLogin
+
+
+# Versão do formato do arquivo de linha de base
+BASELINE_SCHEMA = 1
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "local.json"
+
+INVALID_CREDENTIALS = ("email_invalido@teste.com", "senha_incorreta_123")
+
+# Estado autenticado por URL base, reaproveitado entre as iterações como em um worker da suíte
+_auth_states = {}
+
+
+def _timed(action):
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_startup(flow, driver, base_url, headless):
+    """Inicialização de um Chrome novo (não usa a sessão compartilhada)."""
+    start = time.perf_counter()
+    new_driver = create_chrome_driver(headless=headless)
+    try:
+        new_driver.get("about:blank")
+        return (time.perf_counter() - start) * 1000
+    finally:
+        new_driver.quit()
+
+
+def bench_navigation(flow, driver, base_url, headless):
+    return _timed(lambda: flow._navigate_to_login(driver, base_url))
+
+
+def bench_form_fill(flow, driver, base_url, headless):
+    flow._navigate_to_login(driver, base_url)
+    return _timed(lambda: (
+        flow._fill_email(driver, VALID_CREDENTIALS["email"]),
+        flow._fill_password(driver, VALID_CREDENTIALS["password"]),
+    ))
+
+
+def bench_error_detection(flow, driver, base_url, headless):
+    flow._navigate_to_login(driver, base_url)
+    flow._fill_email(driver, INVALID_CREDENTIALS[0])
+    flow._fill_password(driver, INVALID_CREDENTIALS[1])
+    flow._submit_form(driver)
+    flow._wait_for_api_response(driver)
+    return _timed(lambda: flow._find_error_message(driver))
+
+
+def bench_full_test(flow, driver, base_url, headless):
+    def login():
+        flow._navigate_to_login(driver, base_url)
+        flow._fill_email(driver, VALID_CREDENTIALS["email"])
+        flow._fill_password(driver, VALID_CREDENTIALS["password"])
+        flow._submit_form(driver)
+        WebDriverWait(driver, 10).until(lambda d: d.current_url.rstrip("/").endswith("/dashboard"))
+    return _timed(login)
+
+
+def bench_restored_session(flow, driver, base_url, headless):
+    auth = _auth_states.get(base_url)
+    if auth is None:
+        auth = _auth_states[base_url] = AuthState(base_url, VALID_CREDENTIALS)
+    if auth.snapshot is None:
+        auth.refresh(driver)  # O login real acontece uma vez, fora da medição
+        DriverPool.reset(driver)
+    return _timed(lambda: auth.open(driver))
+
+
+# Nome do cenário -> função que executa uma iteração e retorna o tempo medido (ms)
+SCENARIOS = {
+    "inicializacao": bench_startup,
+    "navegacao": bench_navigation,
+    "preenchimento": bench_form_fill,
+    "deteccao_erro": bench_error_detection,
+    "teste_completo": bench_full_test,
+    "sessao_restaurada": bench_restored_session,
+}
+
+
+def bootstrap_ratio_ci(baseline, current, resamples=2000, confidence=0.95, seed=0):
+    """
+    Intervalo de confiança (bootstrap) da razão entre as medianas atual e da linha de base.
+    Retorna (razão observada, limite inferior, limite superior).
+    """
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(resamples):
+        base_sample = [rng.choice(baseline) for _ in baseline]
+        current_sample = [rng.choice(current) for _ in current]
+        ratios.append(statistics.median(current_sample) / max(statistics.median(base_sample), 1e-9))
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (resamples - 1))]
+    high = ratios[int((1 - tail) * (resamples - 1))]
+    return statistics.median(current) / max(statistics.median(baseline), 1e-9), low, high
+
+
+def compare(baseline, current, threshold, resamples=2000):
+    """Classifica cada cenário presente nas duas execuções como regressão, melhoria ou estável."""
+    verdicts = {}
+    for name, data in current["scenarios"].items():
+        reference = baseline["scenarios"].get(name)
+        if reference is None:
+            continue
+        ratio, low, high = bootstrap_ratio_ci(reference["samples_ms"], data["samples_ms"], resamples)
+        if low > 1 + threshold:
+            verdict = "regressao"
+        elif high < 1 - threshold:
+            verdict = "melhoria"
+        else:
+            verdict = "estavel"
+        verdicts[name] = {"ratio": round(ratio, 4), "ci": [round(low, 4), round(high, 4)], "verdict": verdict}
+    return verdicts
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args, base_url):
+    """Executa os cenários e retorna o resultado no formato da linha de base."""
+    flow = TestLogin()
+    flow.input_mode = args.input_mode
+    driver = create_chrome_driver(headless=args.headless)
+    samples = {name: [] for name in args.scenario}
+    try:
+        for iteration in range(args.warmup + args.repeat):
+            # Os cenários se alternam a cada iteração para que variações do ambiente afetem todos igualmente
+            for name in args.scenario:
+                elapsed = SCENARIOS[name](flow, driver, base_url, args.headless)
+                DriverPool.reset(driver)
+                if iteration >= args.warmup:
+                    samples[name].append(round(elapsed, 3))
+        browser_version = driver.capabilities.get("browserVersion")
+    finally:
+        driver.quit()
+
+    return {
+        "schema": BASELINE_SCHEMA,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "environment": {
+            "chrome_version": browser_version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "headless": args.headless,
+            "input_mode": args.input_mode,
+        },
+        "repeat": args.repeat,
+        "scenarios": {
+            name: {
+                "samples_ms": values,
+                "median_ms": round(statistics.median(values), 3),
+                "min_ms": min(values),
+            }
+            for name, values in samples.items()
+        },
+    }
+
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("schema") != BASELINE_SCHEMA:
+        raise SystemExit(
+            f"Linha de base {path} usa o formato {baseline.get('schema')}; "
+            f"regrave-a com --update-baseline (formato atual: {BASELINE_SCHEMA})."
+        )
+    return baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Cenário a executar (repetível; padrão: todos).")
+    parser.add_argument("--repeat", type=int, default=15, help="Amostras medidas por cenário.")
+    parser.add_argument("--warmup", type=int, default=2, help="Iterações descartadas antes da medição.")
+    parser.add_argument("--base-url", help="Aplicação alvo (padrão: servidor local simulado).")
+    parser.add_argument("--input-mode", choices=INPUT_MODES, default=KEYSTROKE)
+    parser.add_argument("--headed", dest="headless", action="store_false", help="Executa com a janela visível.")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Arquivo da linha de base.")
+    parser.add_argument("--update-baseline", action="store_true", help="Grava o resultado como nova linha de base.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Piora relativa tolerada antes de apontar regressão (0.10 = 10%%).")
+    parser.add_argument("--resamples", type=int, default=2000, help="Reamostragens do bootstrap.")
+    parser.add_argument("--output", help="Arquivo JSON com o resultado e a comparação desta execução.")
+    args = parser.parse_args()
+    args.scenario = args.scenario or list(SCENARIOS)
+
+    app = None
+    base_url = args.base_url
+    if base_url is None:
+        app = FakeLoginApp(VALID_CREDENTIALS).start()
+        base_url = app.url
+    try:
+        result = run(args, base_url)
+    finally:
+        if app is not None:
+            app.stop()
+
+    baseline_path = Path(args.baseline)
+    verdicts = {}
+    if not args.update_baseline and baseline_path.exists():
+        baseline = load_baseline(baseline_path)
+        if baseline["environment"].get("chrome_version") != result["environment"]["chrome_version"]:
+            print(f"Aviso: linha de base medida com Chrome {baseline['environment'].get('chrome_version')}, "
+                  f"execução atual com Chrome {result['environment']['chrome_version']}.")
+        verdicts = compare(baseline, result, args.threshold, args.resamples)
+        result["comparison"] = {"baseline": str(baseline_path), "git_revision": baseline.get("git_revision"),
+                                "threshold": args.threshold, "scenarios": verdicts}
+
+    print(f"{'cenário':<16}{'mediana (ms)':>14}{'mínimo (ms)':>14}{'razão':>9}{'IC 95%':>18}  resultado")
+    for name, data in result["scenarios"].items():
+        line = f"{name:<16}{data['median_ms']:>14.1f}{data['min_ms']:>14.1f}"
+        if name in verdicts:
+            verdict = verdicts[name]
+            interval = f"[{verdict['ci'][0]:.3f}, {verdict['ci'][1]:.3f}]"
+            line += f"{verdict['ratio']:>9.3f}{interval:>18}  {verdict['verdict']}"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.update_baseline or not baseline_path.exists():
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"Linha de base gravada em {baseline_path}; versione o arquivo junto com o código.")
+
+    if any(verdict["verdict"] == "regressao" for verdict in verdicts.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
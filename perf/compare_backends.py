@@ -0,0 +1,124 @@
+"""
+Comparação entre os backends do driver: WebDriver clássico (HTTP via
+chromedriver) e CDP (WebSocket persistente do DevTools, `--driver-backend cdp`).
+
+Mede, contra o servidor local simulado:
+
+- latência das operações que os helpers de `TestLogin` usam (navegação,
+  busca de elemento, digitação, leitura de atributo, execute_script e clique);
+- tempo total de `tests/test_login.py` executado com cada backend.
+
+Uso:
+    python -m perf.compare_backends [--repeat 20] [--suite-runs 3] [--json comparacao.json]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from tests.conftest import VALID_CREDENTIALS, create_chrome_driver
+from tests.pages.login_page import LoginPage
+from tests.support.cdp import DRIVER_BACKENDS, require_backend, wrap_driver
+from tests.support.fake_app import FakeLoginApp
+from tests.support.pool import DriverPool
+
+
+def _timed(samples, name, action):
+    start = time.perf_counter()
+    result = action()
+    samples.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def measure_commands(backend, base_url, repeat):
+    """Latência (ms) de cada operação do fluxo de login com o backend informado."""
+    raw = driver = create_chrome_driver(headless=True)
+    samples = {}
+    try:
+        driver = wrap_driver(raw, backend)
+        for iteration in range(repeat + 1):
+            current = {} if iteration == 0 else samples  # A primeira iteração é aquecimento
+            _timed(current, "get", lambda: driver.get(base_url))
+            email = _timed(current, "find_element", lambda: driver.find_element(By.ID, LoginPage.EMAIL_INPUT_ID))
+            _timed(current, "send_keys", lambda: email.send_keys(VALID_CREDENTIALS["email"]))
+            _timed(current, "get_attribute", lambda: email.get_attribute("value"))
+            _timed(current, "execute_script", lambda: driver.execute_script("return document.forms.length;"))
+            button = driver.find_element(*LoginPage.LOCATORS["submit"])
+            _timed(current, "click", button.click)
+            DriverPool.reset(raw)
+    finally:
+        driver.quit()
+    return samples
+
+
+def measure_suite(backend, runs):
+    """
+    Tempo total (s) de tests/test_login.py com o backend informado.
+    Uma execução com falha encerra a comparação: o tempo de uma suíte que
+    falhou (ou nem chegou a rodar) não é comparável.
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run = subprocess.run(
+            [sys.executable, "-m", "pytest", "tests/test_login.py", "--local-app", "--driver-backend", backend,
+             "-q", "-p", "no:cacheprovider", "-o", "addopts="],
+            capture_output=True,
+            text=True,
+        )
+        durations.append(time.perf_counter() - start)
+        if run.returncode != 0:
+            output = (run.stdout + run.stderr).strip().splitlines()
+            raise SystemExit(
+                f"tests/test_login.py falhou com o backend {backend} (código {run.returncode}); "
+                "comparação descartada.\n" + "\n".join(output[-20:])
+            )
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", action="append", choices=DRIVER_BACKENDS, help="Backend a medir (padrão: todos).")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetições do fluxo na medição por operação.")
+    parser.add_argument("--suite-runs", type=int, default=3, help="Execuções completas da suíte por backend (0 desativa).")
+    parser.add_argument("--json", help="Arquivo para gravar os resultados em JSON.")
+    args = parser.parse_args()
+    backends = args.backend or list(DRIVER_BACKENDS)
+    for backend in backends:
+        require_backend(backend)
+
+    app = FakeLoginApp(VALID_CREDENTIALS).start()
+    results = {}
+    try:
+        for backend in backends:
+            samples = measure_commands(backend, app.url, args.repeat)
+            results[backend] = {
+                "commands": {
+                    name: {"median_ms": statistics.median(values), "p95_ms": sorted(values)[int(0.95 * (len(values) - 1))]}
+                    for name, values in samples.items()
+                },
+            }
+    finally:
+        app.stop()
+    for backend in backends:
+        if args.suite_runs:
+            suite = measure_suite(backend, args.suite_runs)
+            results[backend]["suite_s"] = {"median": statistics.median(suite), "min": min(suite)}
+
+    print(f"{'operação':<16}" + "".join(f"{backend + ' (ms)':>18}" for backend in backends))
+    for name in results[backends[0]]["commands"]:
+        print(f"{name:<16}" + "".join(f"{results[backend]['commands'][name]['median_ms']:>18.2f}" for backend in backends))
+    if args.suite_runs:
+        print(f"{'suíte (s)':<16}" + "".join(f"{results[backend]['suite_s']['median']:>18.2f}" for backend in backends))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
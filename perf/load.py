@@ -0,0 +1,225 @@
+"""
+Geração de carga concorrente sobre o fluxo de login.
+Reutiliza a sequência dos testes (_navigate_to_login, _fill_email,
+_fill_password, _submit_form) em dois níveis:
+
+- browser: um pool de Chrome headless executando o fluxo completo pela interface;
+- http: reprodução leve apenas da requisição de login, com conexões keep-alive.
+
+Concorrência, rampa de subida e duração são configuráveis. Cada requisição é
+gravada incrementalmente em JSONL e as estatísticas (vazão, p50/p95/p99 e
+taxa de erro) são mantidas em memória constante.
+
+Uso:
+    python -m perf.load --tier http --base-url http://localhost:3001 --concurrency 50 --duration 60
+    python -m perf.load --tier browser --concurrency 4 --ramp-up 10 --duration 120 --output carga.jsonl
+"""
+import argparse
+import itertools
+import json
+import math
+import queue
+import threading
+import time
+from collections import Counter
+
+import urllib3
+
+from tests.conftest import VALID_CREDENTIALS
+
+
+# Combinações de credenciais enviadas pela carga e o status esperado para cada uma
+SCENARIOS = {
+    "valid": [(VALID_CREDENTIALS["email"], VALID_CREDENTIALS["password"], 200)],
+    "invalid": [
+        ("email_invalido@teste.com", VALID_CREDENTIALS["password"], 422),
+        (VALID_CREDENTIALS["email"], "senha_incorreta_123", 422),
+        ("usuario_inexistente@teste.com", "senha_qualquer", 422),
+    ],
+}
+SCENARIOS["mixed"] = SCENARIOS["valid"] + SCENARIOS["invalid"]
+
+
+class LatencyHistogram:
+    """
+    Histograma logarítmico de latências (resolução de ~1%).
+    Ocupa memória proporcional ao número de faixas, não ao de amostras.
+    """
+
+    GROWTH = 1.01
+
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+
+    def add(self, value_ms):
+        index = int(math.log(max(value_ms, 0.001), self.GROWTH))
+        self.buckets[index] += 1
+        self.count += 1
+
+    def percentile(self, p):
+        if not self.count:
+            return None
+        target = p / 100 * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return self.GROWTH ** (index + 1)
+        return self.GROWTH ** (max(self.buckets) + 1)
+
+
+class ResultSink:
+    """Recebe os resultados das threads, grava-os em JSONL e agrega as estatísticas."""
+
+    def __init__(self, output):
+        self.histogram = LatencyHistogram()
+        self.outcomes = Counter()
+        self.statuses = Counter()
+        self._queue = queue.Queue(maxsize=10000)
+        self._output = open(output, "w", encoding="utf-8") if output else None
+        self._thread = threading.Thread(target=self._drain, name="load-results", daemon=True)
+        self._thread.start()
+
+    def record(self, result):
+        self._queue.put(result)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self._output:
+            self._output.close()
+
+    def _drain(self):
+        while True:
+            result = self._queue.get()
+            if result is None:
+                return
+            self.histogram.add(result["latency_ms"])
+            self.outcomes["ok" if result["ok"] else "error"] += 1
+            self.statuses[str(result["status"])] += 1
+            if self._output:
+                self._output.write(json.dumps(result) + "\n")
+
+
+def http_worker(args, deadline, sink):
+    """Reproduz apenas a requisição de login com um pool de conexões keep-alive."""
+    http = urllib3.PoolManager(maxsize=1, retries=False, timeout=urllib3.Timeout(total=args.timeout))
+    url = args.base_url.rstrip("/") + args.api_path
+    for email, password, expected in itertools.cycle(SCENARIOS[args.credentials]):
+        if time.monotonic() >= deadline:
+            break
+        start = time.perf_counter()
+        try:
+            status = http.request(
+                "POST", url, body=json.dumps({"email": email, "password": password}),
+                headers={"Content-Type": "application/json"},
+            ).status
+        except urllib3.exceptions.HTTPError:
+            status = None
+        latency = (time.perf_counter() - start) * 1000
+        sink.record({"tier": "http", "at": time.time(), "status": status, "expected": expected,
+                     "ok": status == expected, "latency_ms": round(latency, 3)})
+    http.clear()
+
+
+def browser_worker(args, deadline, sink):
+    """Executa o fluxo de login dos testes em um Chrome headless dedicado."""
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    from tests.conftest import create_chrome_driver
+    from tests.support.pool import DriverPool
+    from tests.test_login import TestLogin
+
+    flow = TestLogin()
+    driver = create_chrome_driver(headless=True)
+    try:
+        for email, password, expected in itertools.cycle(SCENARIOS[args.credentials]):
+            if time.monotonic() >= deadline:
+                break
+            start = time.perf_counter()
+            status = error = None
+            try:
+                flow._navigate_to_login(driver, args.base_url)
+                login_url = driver.current_url
+                flow._fill_email(driver, email)
+                flow._fill_password(driver, password)
+                flow._submit_form(driver)
+                response = flow._wait_for_api_response(driver, timeout=args.timeout)
+                status = response.status if response is not None else None
+                if status is None and expected == 200:
+                    # O redirecionamento descarregou a página antes de a resposta ser lida
+                    WebDriverWait(driver, args.timeout).until(EC.url_changes(login_url))
+                    status = 200
+            except Exception as exc:
+                error = type(exc).__name__
+            latency = (time.perf_counter() - start) * 1000
+            try:
+                DriverPool.reset(driver)
+            except Exception as exc:
+                error = error or f"reset: {type(exc).__name__}"
+            sink.record({"tier": "browser", "at": time.time(), "status": status, "expected": expected,
+                         "ok": status == expected and error is None, "latency_ms": round(latency, 3), "error": error})
+    finally:
+        driver.quit()
+
+
+def run(args):
+    """Inicia os workers com a rampa configurada e retorna o resumo da execução."""
+    sink = ResultSink(args.output)
+    worker = http_worker if args.tier == "http" else browser_worker
+    started = time.monotonic()
+    deadline = started + args.ramp_up + args.duration
+    threads = []
+    for index in range(args.concurrency):
+        delay = args.ramp_up * index / args.concurrency
+        thread = threading.Thread(
+            target=lambda d=delay: (time.sleep(d), worker(args, deadline, sink)),
+            name=f"load-{index}",
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    sink.close()
+
+    total = sink.histogram.count
+    percentiles = {f"p{p}": sink.histogram.percentile(p) for p in (50, 95, 99)}
+    return {
+        "tier": args.tier,
+        "concurrency": args.concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 3) if elapsed else 0.0,
+        "error_rate": round(sink.outcomes["error"] / total, 4) if total else 0.0,
+        "statuses": dict(sink.statuses),
+        "latency_ms": {name: round(value, 2) if value is not None else None for name, value in percentiles.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tier", choices=("http", "browser"), default="http")
+    parser.add_argument("--base-url", default="http://localhost:3001")
+    parser.add_argument("--api-path", default="/api/login", help="Caminho do endpoint de login (nível http).")
+    parser.add_argument("--credentials", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=10, help="Número de usuários simultâneos.")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Segundos para atingir a concorrência total.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Segundos em concorrência total.")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Tempo limite por requisição (s).")
+    parser.add_argument("--output", help="Arquivo JSONL com o resultado de cada requisição.")
+    parser.add_argument("--summary", help="Arquivo JSON com o resumo da execução.")
+    args = parser.parse_args()
+
+    summary = run(args)
+    print(json.dumps(summary, indent=2))
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
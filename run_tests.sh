@@ -6,8 +6,8 @@
 echo "🚀 Iniciando testes automatizados de login..."
 echo ""
 
-# Verifica se o servidor está rodando
-if ! curl -s http://localhost:3001 > /dev/null 2>&1; then
+# Verifica se o servidor está rodando (não necessário com o servidor local simulado)
+if [ "$1" != "--local" ] && [ "$1" != "--bench" ] && ! curl -s http://localhost:3001 > /dev/null 2>&1; then
     echo "⚠️  AVISO: Não foi possível conectar ao servidor em http://localhost:3001"
     echo "   Certifique-se de que o servidor está rodando antes de executar os testes."
     echo ""
@@ -17,6 +17,28 @@ fi
 if [ "$1" == "--html" ]; then
     echo "📊 Executando testes com relatório HTML..."
     pytest tests/ --html=report.html --self-contained-html
+elif [ "$1" == "--parallel" ]; then
+    # Distribui os testes entre workers (um por núcleo por padrão), equilibrando a
+    # carga pelo histórico de duração, e gera um único relatório
+    WORKERS="${2:-auto}"
+    echo "⚡ Executando testes em paralelo (workers: $WORKERS)..."
+    pytest tests/ -n "$WORKERS" --dist loadgroup --schedule-by-history --html=report.html --self-contained-html
+elif [ "$1" == "--local" ]; then
+    echo "🏠 Executando testes contra o servidor de login simulado local..."
+    pytest tests/ --local-app -v
+elif [ "$1" == "--bench" ]; then
+    # Demais argumentos são repassados ao benchmark (ex.: --update-baseline, --repeat 30)
+    echo "⏱️  Executando benchmarks da suíte contra o servidor local simulado..."
+    python -m perf.bench_suite "${@:2}"
+    STATUS=$?
+    if [ $STATUS -ne 0 ]; then
+        echo ""
+        echo "❌ Regressão de desempenho detectada (ou falha no benchmark)."
+        exit $STATUS
+    fi
+elif [ "$1" == "--api" ]; then
+    echo "🔌 Executando apenas testes de contrato da API (sem navegador)..."
+    pytest tests/ -m api -v
 elif [ "$1" == "--verbose" ] || [ "$1" == "-v" ]; then
     echo "📝 Executando testes em modo verbose..."
     pytest tests/ -v
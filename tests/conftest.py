@@ -2,8 +2,10 @@
 Configuração base para os testes Selenium.
 Define fixtures compartilhadas e configuração do WebDriver.
 """
+import functools
 import os
 import pytest
+import urllib3
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -13,11 +15,278 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from tests.support.artifacts import ArtifactPlugin
+from tests.support.auth import AuthState
+from tests.support.blocking import ResourceBlocker, ResourceBlockingPlugin
+from tests.support.browser import IsolatedChrome, free_port
+from tests.support.cdp import DRIVER_BACKENDS, WEBDRIVER, require_backend, wrap_driver
+from tests.support.chromedriver_cache import cached_chromedriver_path
+from tests.support.corpus import CORPUS_INDEX_KEY
+from tests.support.fake_app import FakeLoginApp, parse_profiles
+from tests.support.input_modes import INPUT_MODES, KEYSTROKE, InputTimingPlugin, marker_input_mode
+from tests.support.network import SCRIPT_TIMEOUT
+from tests.support.pool import DriverPool
+from tests.support.profile import FAST_STARTUP_ARGS, ensure_profile_template, tmpfs_root
+from tests.support.resources import POOLED_SESSION_KEY, ResourceLimits, ResourceMonitorPlugin, require_psutil
+from tests.support.scheduling import SchedulingPlugin
+from tests.support.timing import Budget, PageTimingCollector, PageTimingPlugin
+from tests.support.tracing import TracingPlugin
+
+
+# Credenciais aceitas pela aplicação (e pelo servidor local simulado)
+VALID_CREDENTIALS = {
+    "email": "test@universitypresence.com",
+    "password": "123456"
+}
+
+# URL da aplicação quando os testes não usam --local-app
+APP_URL = "http://localhost:3001"
+
+
+def pytest_addoption(parser):
+    """Opções de linha de comando da suíte."""
+    group = parser.getgroup("webdriver")
+    group.addoption(
+        "--fresh-driver",
+        action="store_true",
+        default=False,
+        help="Inicia um Chrome novo por teste (isolamento total, sem pool de sessões).",
+    )
+    group.addoption(
+        "--driver-max-uses",
+        type=int,
+        default=50,
+        help="Número de testes atendidos por uma sessão do pool antes de ser reciclada.",
+    )
+    
+    group.addoption(
+        "--driver-backend",
+        choices=DRIVER_BACKENDS,
+        default=WEBDRIVER,
+        help="Como os testes falam com o navegador: 'webdriver' (HTTP via chromedriver) ou 'cdp' "
+             "(WebSocket persistente do DevTools, comandos em pipeline; requer o pacote websockets).",
+    )
+    group.addoption(
+        "--fast-startup",
+        action="store_true",
+        default=False,
+        help="Chrome headless (novo modo), sem extensões/sincronização/primeira execução, com perfil pré-aquecido copiado para tmpfs.",
+    )
+    group.addoption(
+        "--block-resources",
+        action="store_true",
+        default=False,
+        help="Bloqueia imagens, fontes, analytics e outros recursos não essenciais (regras em pytest.ini).",
+    )
+    group.addoption(
+        "--input-mode",
+        choices=INPUT_MODES,
+        default=KEYSTROKE,
+        help="Preenchimento dos campos: 'keystroke' (send_keys, um evento por caractere) ou 'bulk' (valor e eventos input/change em uma chamada).",
+    )
+    group.addoption(
+        "--page-timing",
+        action="store_true",
+        default=False,
+        help="Coleta Navigation/Resource Timing, FCP/LCP e long tasks das páginas e aplica os orçamentos de perf_budgets.",
+    )
+    group.addoption(
+        "--trace-commands",
+        action="store_true",
+        default=False,
+        help="Registra cada comando do WebDriver por teste (idas e voltas, tempo em comandos e esperas).",
+    )
+    group.addoption(
+        "--trace-dir",
+        default="traces",
+        help="Diretório dos arquivos JSON gerados por --trace-commands.",
+    )
+    group.addoption(
+        "--resource-monitor",
+        action="store_true",
+        default=False,
+        help="Mede RSS, CPU, descritores e processos filhos do navegador a cada teste, recicla sessões acima "
+             "dos limites (resource_* no pytest.ini) e finaliza processos órfãos ao final (requer psutil).",
+    )
+    group.addoption(
+        "--artifacts",
+        action="store_true",
+        default=False,
+        help="Captura screenshot, DOM, console do navegador e HAR dos testes que falharem.",
+    )
+    group.addoption(
+        "--artifacts-sample",
+        type=float,
+        default=0.0,
+        metavar="TAXA",
+        help="Fração (0..1) dos testes aprovados que também têm os artefatos capturados (implica --artifacts).",
+    )
+    group.addoption(
+        "--artifacts-dir",
+        default="artifacts",
+        help="Diretório dos artefatos capturados por --artifacts.",
+    )
+    
+    group = parser.getgroup("aplicação")
+    group.addoption(
+        "--local-app",
+        action="store_true",
+        default=False,
+        help="Executa os testes contra o servidor de login simulado local, em uma porta livre.",
+    )
+    group.addoption(
+        "--local-app-profile",
+        action="append",
+        default=[],
+        metavar="CAMINHO=LATENCIA[:VARIACAO[:TAXA_ERRO]]",
+        help="Latência (ms), variação (ms) e taxa de erro de um endpoint do servidor local. Ex.: /api/login=200:50:0.05",
+    )
+    
+    group = parser.getgroup("agendamento")
+    group.addoption(
+        "--schedule-by-history",
+        action="store_true",
+        default=False,
+        help="Ordena os testes pelo histórico: falhas recentes primeiro, depois do mais longo para o mais curto "
+             "(com -n e --dist loadgroup, equilibra a carga estimada entre os workers).",
+    )
+    group.addoption(
+        "--fail-fast",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Interrompe a execução após N falhas, com os testes ordenados pelo histórico (implica --schedule-by-history).",
+    )
+    
+    group = parser.getgroup("matriz de credenciais")
+    group.addoption(
+        "--corpus",
+        action="append",
+        default=[],
+        metavar="CAMINHO",
+        help="Arquivo CSV/JSONL (ou diretório) com casos de credenciais para a matriz data-driven. Pode ser repetido.",
+    )
+    group.addoption(
+        "--corpus-batch-size",
+        type=int,
+        default=50,
+        help="Casos executados em sequência na mesma sessão do navegador por teste da matriz (mínimo 1).",
+    )
+    parser.addini(
+        "block_resource_types",
+        "Tipos de recurso bloqueados com --block-resources (image, font, media, stylesheet, script, ...).",
+        type="linelist",
+        default=["image", "font", "media"],
+    )
+    parser.addini(
+        "block_url_patterns",
+        "Padrões de URL (curinga *) sempre bloqueados com --block-resources.",
+        type="linelist",
+        default=[
+            "*google-analytics.com*",
+            "*googletagmanager.com*",
+            "*doubleclick.net*",
+            "*facebook.net*",
+            "*hotjar.com*",
+            "*segment.io*",
+            "*/analytics.js*",
+        ],
+    )
+    parser.addini(
+        "allow_url_patterns",
+        "Padrões de URL (curinga *) nunca bloqueados pelos tipos de recurso de --block-resources.",
+        type="linelist",
+        default=[],
+    )
+    parser.addini(
+        "perf_budgets",
+        "Orçamentos de desempenho aplicados com --page-timing, um por linha: PAGINA.METRICA <= VALOR.",
+        type="linelist",
+        default=[],
+    )
+    parser.addini("perf_timing_output", "Arquivo JSON com as métricas de desempenho da execução.", default="page-timing.json")
+    parser.addini("resource_max_rss_mb", "RSS máximo (MB) da árvore de processos de uma sessão; 0 desativa.", default="1500")
+    parser.addini("resource_max_rss_growth_mb", "Crescimento máximo do RSS (MB) durante um teste; 0 desativa.", default="300")
+    parser.addini("resource_max_fds", "Descritores de arquivo abertos máximos por sessão; 0 desativa.", default="2000")
+    parser.addini("resource_max_children", "Processos filhos máximos do chromedriver por sessão; 0 desativa.", default="40")
+    parser.addini("auth_landing_path", "Página pós-login usada pelo estado autenticado reaproveitado.", default="/dashboard")
+    parser.addini(
+        "require_login_api_response",
+        "Testes de interface falham se a resposta da API de login não for observada na página (fetch/XHR).",
+        type="bool",
+        default=True,
+    )
+    parser.addini("login_api_path", "Caminho do endpoint de login usado pelos testes de API.", default="/api/login")
+
+
+def pytest_configure(config):
+    """Registra os plugins opcionais da suíte conforme as opções informadas."""
+    require_backend(config.getoption("--driver-backend"))
+    if config.getoption("--corpus-batch-size") < 1:
+        raise pytest.UsageError("--corpus-batch-size deve ser pelo menos 1")
+    config.pluginmanager.register(InputTimingPlugin(getattr(config, "cache", None)), "qa-input-timing")
+    fail_fast = config.getoption("--fail-fast")
+    if fail_fast:
+        config.option.maxfail = fail_fast
+    if hasattr(config, "cache"):
+        reorder = config.getoption("--schedule-by-history") or bool(fail_fast)
+        config.pluginmanager.register(SchedulingPlugin(config, reorder), "qa-scheduling")
+    if config.getoption("--trace-commands"):
+        config.pluginmanager.register(TracingPlugin(config.getoption("--trace-dir")), "qa-tracing")
+    if config.getoption("--resource-monitor"):
+        require_psutil()
+        limits = ResourceLimits(
+            max_rss_mb=float(config.getini("resource_max_rss_mb")),
+            max_rss_growth_mb=float(config.getini("resource_max_rss_growth_mb")),
+            max_fds=int(config.getini("resource_max_fds")),
+            max_children=int(config.getini("resource_max_children")),
+        )
+        config.pluginmanager.register(ResourceMonitorPlugin(limits), "qa-resource-monitor")
+    if artifacts_enabled(config):
+        plugin = ArtifactPlugin(config.getoption("--artifacts-dir"), sample_rate=config.getoption("--artifacts-sample"))
+        config.pluginmanager.register(plugin, "qa-artifacts")
+    if config.getoption("--page-timing"):
+        for spec in config.getini("perf_budgets"):
+            Budget.parse(spec)  # Valida os orçamentos antes de iniciar os testes
+        config.pluginmanager.register(PageTimingPlugin(config.getini("perf_timing_output")), "qa-page-timing")
+    if config.getoption("--block-resources"):
+        blocker = ResourceBlocker(
+            deny_types=config.getini("block_resource_types"),
+            deny_patterns=config.getini("block_url_patterns"),
+            allow_patterns=config.getini("allow_url_patterns"),
+        )
+        config.pluginmanager.register(ResourceBlockingPlugin(blocker), "qa-resource-blocking")
+
+
+def pytest_sessionfinish(session):
+    """Remove o arquivo temporário do corpus da matriz de credenciais."""
+    index = session.config.stash.get(CORPUS_INDEX_KEY, None)
+    if index is not None:
+        index.close()
+
+
+def artifacts_enabled(config):
+    return config.getoption("--artifacts") or config.getoption("--artifacts-sample") > 0
+
 
 def get_chromedriver_path():
     """
     Retorna o caminho do ChromeDriver.
-    Prioriza chromedriver local, depois tenta webdriver-manager.
+    Um driver indicado explicitamente (no diretório do projeto ou em
+    CHROMEDRIVER_PATH) é sempre usado. Os demais são resolvidos uma vez e
+    reaproveitados entre sessões enquanto o Chrome instalado e o binário do
+    driver não mudarem (veja `chromedriver_cache`).
+    """
+    explicit_path = explicit_chromedriver_path()
+    if explicit_path:
+        return explicit_path
+    return cached_chromedriver_path(resolve_chromedriver_path)
+
+
+def explicit_chromedriver_path():
+    """
+    ChromeDriver indicado pelo usuário, sem consultar o cache.
+    Prioriza chromedriver local, depois a variável CHROMEDRIVER_PATH.
     """
     import platform
     
@@ -35,6 +304,23 @@ def get_chromedriver_path():
     if local_chromedriver.exists() and os.access(local_chromedriver, os.X_OK):
         return str(local_chromedriver.absolute())
     
+    chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
+    if chromedriver_path and os.path.exists(chromedriver_path):
+        if system != "windows":
+            os.chmod(chromedriver_path, 0o755)
+        return chromedriver_path
+    return None
+
+
+def resolve_chromedriver_path():
+    """
+    Resolve o caminho do ChromeDriver sem consultar o cache.
+    Usado quando não há driver explícito: tenta webdriver-manager e depois o PATH.
+    """
+    import platform
+    
+    system = platform.system().lower()
+    
     # Tenta usar webdriver-manager com tratamento de erro melhorado
     try:
         # Tenta instalar sem detectar versão do Chrome (mais robusto)
@@ -63,13 +349,6 @@ def get_chromedriver_path():
             # Se ainda falhar, continua para outras tentativas
             pass
     except Exception as e:
-        # Se falhar, tenta usar chromedriver do PATH ou variável de ambiente
-        chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
-        if chromedriver_path and os.path.exists(chromedriver_path):
-            if system != "windows":
-                os.chmod(chromedriver_path, 0o755)
-            return chromedriver_path
-        
         # Última tentativa: procura no PATH do sistema
         import shutil
         chromedriver_in_path = shutil.which("chromedriver")
@@ -83,44 +362,255 @@ def get_chromedriver_path():
         )
 
 
-@pytest.fixture(scope="function")
-def driver():
+def build_chrome_options(headless=False, fast_startup=False, performance_log=False, browser_log=False):
     """
-    Fixture que inicializa e finaliza o WebDriver para cada teste.
-    Utiliza ChromeDriver local ou gerenciado automaticamente.
+    Opções padrão do Chrome da suíte.
+    `performance_log=True` habilita o log de eventos do DevTools Protocol (bloqueio de recursos e HAR).
+    `browser_log=True` habilita a leitura do console do navegador (artefatos de falha).
     """
     chrome_options = Options()
     # Descomente a linha abaixo para executar em modo headless (sem interface gráfica)
     # chrome_options.add_argument("--headless")
+    if fast_startup:
+        for argument in FAST_STARTUP_ARGS:
+            chrome_options.add_argument(argument)
+    elif headless:
+        chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--remote-debugging-port=9222")
+    logging_prefs = {}
+    if performance_log:
+        logging_prefs["performance"] = "ALL"
+    if browser_log:
+        logging_prefs["browser"] = "ALL"
+    if logging_prefs:
+        chrome_options.set_capability("goog:loggingPrefs", logging_prefs)
+    return chrome_options
+
+
+def _warm_up_profile(user_data_dir):
+    """Inicia e finaliza o Chrome no diretório informado, concluindo o trabalho de primeira execução."""
+    chrome_options = build_chrome_options(fast_startup=True)
+    chrome_options.add_argument(f"--remote-debugging-port={free_port()}")
+    chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    service = Service(get_chromedriver_path(), port=free_port())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    try:
+        driver.get("about:blank")
+    finally:
+        driver.quit()
+
+
+def create_chrome_driver(headless=False, fast_startup=False, performance_log=False, browser_log=False):
+    """
+    Inicia uma nova sessão do Chrome com as opções padrão da suíte.
+    `headless=True` é usado pelas ferramentas de `perf/` que abrem vários navegadores.
+    `fast_startup=True` usa as flags de inicialização rápida e um perfil pré-aquecido copiado para tmpfs.
+    """
+    chrome_options = build_chrome_options(
+        headless=headless, fast_startup=fast_startup, performance_log=performance_log, browser_log=browser_log,
+    )
+    
+    # Porta do chromedriver, porta de depuração e perfil exclusivos por sessão,
+    # para que workers paralelos (pytest-xdist) não disputem os mesmos recursos
+    chromedriver_path = get_chromedriver_path()
+    service = Service(chromedriver_path, port=free_port())
+    if fast_startup:
+        driver = IsolatedChrome(
+            options=chrome_options,
+            service=service,
+            profile_template=ensure_profile_template(_warm_up_profile),
+            profile_root=tmpfs_root(),
+        )
+    else:
+        driver = IsolatedChrome(options=chrome_options, service=service)
+    # Definido uma vez por sessão: as esperas assíncronas contam com esse limite sem reconfigurá-lo
+    try:
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+    except Exception:
+        driver.quit()
+        raise
+    return driver
+
+
+def driver_factory(config):
+    """Função que cria sessões do Chrome conforme as opções da linha de comando."""
+    return functools.partial(
+        create_chrome_driver,
+        fast_startup=config.getoption("--fast-startup"),
+        performance_log=config.getoption("--block-resources") or artifacts_enabled(config),
+        browser_log=artifacts_enabled(config),
+    )
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Pool de sessões do Chrome compartilhado por toda a execução.
+    As sessões são restauradas entre testes e recicladas após `--driver-max-uses` testes.
+    """
+    pool = DriverPool(driver_factory(request.config), max_uses=request.config.getoption("--driver-max-uses"))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(request):
+    """
+    Fixture que fornece o WebDriver para cada teste.
+    Por padrão reaproveita uma sessão do pool; com `--fresh-driver` inicia
+    e finaliza um Chrome dedicado ao teste. Com `--driver-backend cdp` os
+    comandos dos testes vão pelo DevTools Protocol (veja `support/cdp.py`).
+    """
+    backend = request.config.getoption("--driver-backend")
+    if request.config.getoption("--block-resources"):
+        request.getfixturevalue("resource_blocking")
+    if request.config.getoption("--fresh-driver"):
+        try:
+            driver = wrap_driver(driver_factory(request.config)(), backend)
+        except Exception as e:
+            pytest.fail(f"Falha ao inicializar o WebDriver: {str(e)}")
+        
+        yield driver
+        
+        driver.quit()
+        return
     
+    pool = request.getfixturevalue("driver_pool")
     try:
-        chromedriver_path = get_chromedriver_path()
-        service = Service(chromedriver_path)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        session = pool.acquire()
     except Exception as e:
         pytest.fail(f"Falha ao inicializar o WebDriver: {str(e)}")
+    # Permite que plugins (ex.: monitor de recursos) marquem a sessão para reciclagem
+    request.node.stash[POOLED_SESSION_KEY] = session
+    try:
+        driver = wrap_driver(session.driver, backend)
+    except Exception as e:
+        pool.release(session)
+        pytest.fail(f"Falha ao conectar o backend {backend}: {str(e)}")
     
     yield driver
     
-    driver.quit()
+    pool.release(session)
+
+
+@pytest.fixture(scope="session")
+def resource_blocking(request, local_app):
+    """
+    Calibra o bloqueio de recursos (`--block-resources`) uma vez por worker,
+    antes do primeiro teste que usa o navegador e fora da fase de execução
+    dos testes (veja `support/blocking.py`).
+    """
+    blocker = request.config.pluginmanager.get_plugin("qa-resource-blocking").blocker
+    if request.config.getoption("--fresh-driver"):
+        driver = driver_factory(request.config)()
+        try:
+            blocker.calibrate(driver, app_url(local_app))
+        finally:
+            driver.quit()
+        return blocker
+    pool = request.getfixturevalue("driver_pool")
+    session = pool.acquire()
+    try:
+        blocker.calibrate(session.driver, app_url(local_app))
+    finally:
+        pool.release(session)
+    return blocker
+
+
+@pytest.fixture
+def input_mode(request):
+    """
+    Estratégia de preenchimento dos campos do teste.
+    O marker `@pytest.mark.input_mode("bulk")` tem prioridade sobre `--input-mode`.
+    """
+    marker = request.node.get_closest_marker("input_mode")
+    if marker is not None:
+        return marker_input_mode(marker)
+    return request.config.getoption("--input-mode")
 
 
 @pytest.fixture
-def base_url():
+def page_timing(request):
+    """
+    Coletor de métricas de desempenho da página.
+    Sem `--page-timing` as chamadas a `collect` não fazem nada.
+    """
+    return PageTimingCollector(
+        request.node,
+        budgets=[Budget.parse(spec) for spec in request.config.getini("perf_budgets")],
+        enabled=request.config.getoption("--page-timing"),
+    )
+
+
+@pytest.fixture(scope="session")
+def local_app(request):
+    """
+    Servidor de login simulado, iniciado apenas com `--local-app`.
+    Cada worker paralelo inicia o seu próprio servidor em uma porta livre.
+    """
+    if not request.config.getoption("--local-app"):
+        yield None
+        return
+    
+    app = FakeLoginApp(
+        VALID_CREDENTIALS,
+        profiles=parse_profiles(request.config.getoption("--local-app-profile")),
+    ).start()
+    yield app
+    app.stop()
+
+
+def app_url(local_app):
+    """URL da aplicação: o servidor local simulado, se iniciado, ou APP_URL."""
+    if local_app is not None:
+        return local_app.url
+    return APP_URL
+
+
+@pytest.fixture
+def base_url(local_app):
     """URL base da aplicação."""
-    return "http://localhost:3001"
+    return app_url(local_app)
 
 
 @pytest.fixture
 def valid_credentials():
     """Credenciais válidas para login."""
-    return {
-        "email": "test@universitypresence.com",
-        "password": "123456"
-    }
+    return dict(VALID_CREDENTIALS)
 
+
+@pytest.fixture(scope="session")
+def auth_state(request, local_app):
+    """
+    Estado autenticado do worker: o login real pela interface acontece uma vez
+    e os cookies/armazenamento resultantes são injetados nos testes seguintes
+    (veja `support/auth.py`).
+    """
+    return AuthState(
+        app_url(local_app),
+        dict(VALID_CREDENTIALS),
+        landing_path=request.config.getini("auth_landing_path"),
+    )
+
+
+@pytest.fixture
+def authenticated_driver(driver, auth_state):
+    """WebDriver já autenticado, na página pós-login, sem passar pela tela de login."""
+    return auth_state.open(driver)
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Cliente HTTP com conexões keep-alive reaproveitadas pelos testes de API."""
+    http = urllib3.PoolManager(maxsize=4, retries=False, timeout=urllib3.Timeout(total=10))
+    yield http
+    http.clear()
+
+
+@pytest.fixture
+def login_api_url(request, base_url):
+    """URL do endpoint de login da API."""
+    return base_url.rstrip("/") + request.config.getini("login_api_path")
@@ -0,0 +1,4 @@
+"""
+Page objects das telas exercitadas pelos testes.
+"""
+from tests.pages.login_page import LoginPage
@@ -0,0 +1,136 @@
+"""
+Page object da tela de login.
+Resolve os elementos uma vez por carregamento da página e reutiliza os
+handles, buscando-os novamente apenas quando ficam obsoletos
+(StaleElementReferenceException).
+"""
+from dataclasses import dataclass
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from tests.support.input_modes import KEYSTROKE, fill
+from tests.support.network import install_network_tracker
+
+
+# Lê os atributos de validação de vários campos em uma única chamada
+_FIELD_STATE_SCRIPT = """
+return Array.prototype.map.call(arguments, function (el) {
+    return {
+        required: el.hasAttribute('required'),
+        validationMessage: el.validationMessage || '',
+        ariaInvalid: el.getAttribute('aria-invalid'),
+        className: el.getAttribute('class') || ''
+    };
+});
+"""
+
+
+@dataclass
+class FieldState:
+    """Estado de validação de um campo do formulário."""
+
+    required: bool
+    validation_message: str
+    aria_invalid: str
+    class_name: str
+
+    @property
+    def is_invalid(self):
+        """Indica validação HTML5, atributo aria-invalid ou classe de erro no campo."""
+        return self.aria_invalid == "true" or "invalid" in self.class_name or self.validation_message != ""
+
+
+class LoginPage:
+    """
+    Tela de login: campos de email e senha e botão de envio.
+    `input_mode` escolhe como os campos são preenchidos ("keystroke" ou "bulk").
+    """
+
+    EMAIL_INPUT_ID = "email"
+    PASSWORD_INPUT_ID = "password"
+    SUBMIT_BUTTON_TYPE = "submit"
+
+    LOCATORS = {
+        "email": (By.ID, EMAIL_INPUT_ID),
+        "password": (By.ID, PASSWORD_INPUT_ID),
+        "submit": (By.CSS_SELECTOR, f"button[type='{SUBMIT_BUTTON_TYPE}']"),
+    }
+
+    def __init__(self, driver, input_mode=KEYSTROKE):
+        self.driver = driver
+        self.input_mode = input_mode
+        self._elements = {}
+
+    def open(self, base_url, timeout=10):
+        """Navega para a página de login e aguarda o formulário."""
+        self.driver.get(base_url)
+        self._elements = {}
+        # Aguarda a página carregar completamente; o handle retornado já fica em cache
+        self._elements["email"] = WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located(self.LOCATORS["email"])
+        )
+        # Passa a observar as requisições fetch/XHR feitas pela página
+        install_network_tracker(self.driver)
+        return self
+
+    def element(self, name):
+        """Retorna o WebElement do campo, resolvendo-o apenas na primeira vez."""
+        element = self._elements.get(name)
+        if element is None:
+            element = self.driver.find_element(*self.LOCATORS[name])
+            self._elements[name] = element
+        return element
+
+    def fill_email(self, email):
+        """Preenche o campo de email."""
+        self._fill("email", email)
+
+    def fill_password(self, password):
+        """Preenche o campo de senha."""
+        self._fill("password", password)
+
+    def submit(self):
+        """Submete o formulário de login."""
+        self._with_element("submit", lambda element: element.click())
+
+    def field_state(self, name):
+        """Estado de validação de um campo ("email" ou "password")."""
+        return self.field_states(name)[0]
+
+    def field_states(self, *names):
+        """Estado de validação de vários campos com uma única chamada ao navegador."""
+        def read():
+            return self.driver.execute_script(_FIELD_STATE_SCRIPT, *[self.element(name) for name in names])
+
+        try:
+            states = read()
+        except StaleElementReferenceException:
+            self._forget(*names)
+            states = read()
+        return [
+            FieldState(
+                required=state["required"],
+                validation_message=state["validationMessage"],
+                aria_invalid=state["ariaInvalid"],
+                class_name=state["className"],
+            )
+            for state in states
+        ]
+
+    def _fill(self, name, value):
+        self._with_element(name, lambda element: fill(self.driver, element, value, self.input_mode))
+
+    def _with_element(self, name, action):
+        """Executa a ação no elemento em cache, buscando-o de novo se estiver obsoleto."""
+        try:
+            return action(self.element(name))
+        except StaleElementReferenceException:
+            self._forget(name)
+            return action(self.element(name))
+
+    def _forget(self, *names):
+        for name in names:
+            self._elements.pop(name, None)
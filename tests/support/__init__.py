@@ -0,0 +1,3 @@
+"""
+Componentes de suporte da suíte de testes (pool de drivers, utilitários de espera, etc.).
+"""
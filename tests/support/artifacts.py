@@ -0,0 +1,196 @@
+"""
+Artefatos de depuração dos testes de interface: screenshot, DOM, console do
+navegador e tráfego de rede em HAR.
+São capturados apenas quando o teste falha ou, com --artifacts-sample, em uma
+amostra dos testes aprovados. A leitura do navegador acontece ao final do
+teste (antes de a sessão voltar ao pool); compressão e gravação em disco ficam
+com uma thread em segundo plano, sem atrasar o próximo teste. Os arquivos são
+ligados ao relatório pytest-html.
+"""
+import gzip
+import json
+import os
+import queue
+import random
+import re
+import threading
+from datetime import datetime, timezone
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from tests.support.perflog import PerformanceLog
+from tests.support.reporting import add_html_extra
+
+
+# Artefatos de texto são gravados com gzip; o PNG já é comprimido
+_COMPRESS_LEVEL = 6
+
+
+def _wall_time(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
+
+
+def _headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def build_har(events):
+    """Monta um HAR 1.2 a partir dos eventos Network.* do log de desempenho."""
+    entries = {}
+    order = []
+    for event in events:
+        params = event["params"]
+        request_id = params.get("requestId")
+        if event["method"] == "Network.requestWillBeSent":
+            request = params["request"]
+            entries[request_id] = {
+                "startedDateTime": _wall_time(params.get("wallTime", 0)),
+                "_start": params.get("timestamp", 0),
+                "time": 0,
+                "request": {
+                    "method": request.get("method"), "url": request.get("url"), "httpVersion": "",
+                    "headers": _headers(request.get("headers")), "queryString": [], "cookies": [],
+                    "headersSize": -1, "bodySize": len(request.get("postData") or ""),
+                },
+                "response": {
+                    "status": 0, "statusText": "", "httpVersion": "", "headers": [], "cookies": [],
+                    "content": {"size": 0, "mimeType": ""}, "redirectURL": "", "headersSize": -1, "bodySize": -1,
+                },
+                "cache": {},
+                "timings": {"send": 0, "wait": 0, "receive": 0},
+            }
+            order.append(request_id)
+        elif request_id in entries:
+            entry = entries[request_id]
+            if event["method"] == "Network.responseReceived":
+                response = params["response"]
+                entry["response"].update({
+                    "status": response.get("status", 0), "statusText": response.get("statusText", ""),
+                    "httpVersion": response.get("protocol", ""), "headers": _headers(response.get("headers")),
+                })
+                entry["response"]["content"]["mimeType"] = response.get("mimeType", "")
+                entry["timings"]["wait"] = round((params.get("timestamp", 0) - entry["_start"]) * 1000, 3)
+            elif event["method"] in ("Network.loadingFinished", "Network.loadingFailed"):
+                entry["time"] = round((params.get("timestamp", 0) - entry["_start"]) * 1000, 3)
+                entry["timings"]["receive"] = max(entry["time"] - entry["timings"]["wait"], 0)
+                if event["method"] == "Network.loadingFinished":
+                    entry["response"]["bodySize"] = params.get("encodedDataLength", -1)
+                    entry["response"]["content"]["size"] = params.get("encodedDataLength", 0)
+                else:
+                    entry["response"]["_error"] = params.get("blockedReason") or params.get("errorText")
+    har_entries = []
+    for request_id in order:
+        entry = entries[request_id]
+        del entry["_start"]
+        har_entries.append(entry)
+    return {"log": {"version": "1.2", "creator": {"name": "qa-university-presence", "version": "1.0"},
+                    "pages": [], "entries": har_entries}}
+
+
+def capture(driver, network=True):
+    """Lê o estado do navegador: (nome do arquivo, conteúdo) de cada artefato disponível."""
+    readers = [
+        ("screenshot.png", driver.get_screenshot_as_png),
+        ("dom.html", lambda: driver.page_source.encode("utf-8")),
+        ("console.json", lambda: json.dumps(driver.get_log("browser"), indent=2).encode("utf-8")),
+    ]
+    if network:
+        readers.append(("network.har", lambda: json.dumps(build_har(PerformanceLog.attach(driver).collect())).encode("utf-8")))
+    artifacts = []
+    for name, read in readers:
+        try:
+            artifacts.append((name, read()))
+        except WebDriverException:
+            continue  # Sessão encerrada ou log indisponível: segue com os demais artefatos
+    return artifacts
+
+
+class ArtifactWriter:
+    """Thread que comprime e grava os artefatos na ordem em que foram capturados."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="qa-artifacts", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, data):
+        self._queue.put((path, data))
+
+    def close(self):
+        """Aguarda a gravação dos artefatos pendentes."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            path, data = job
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if path.endswith(".gz"):
+                    with gzip.open(path, "wb", compresslevel=_COMPRESS_LEVEL) as f:
+                        f.write(data)
+                else:
+                    with open(path, "wb") as f:
+                        f.write(data)
+            except OSError:
+                pass  # Falha ao gravar um artefato não deve interromper a execução
+
+
+class ArtifactPlugin:
+    """Captura os artefatos dos testes que falharam (ou amostrados) e os liga ao relatório."""
+
+    def __init__(self, output_dir, sample_rate=0.0, network=True):
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.network = network
+        self.writer = None
+
+    def pytest_sessionstart(self, session):
+        self.writer = ArtifactWriter()
+
+    def pytest_sessionfinish(self, session):
+        if self.writer is not None:
+            self.writer.close()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        driver = item.funcargs.get("driver")
+        if driver is not None:
+            try:
+                # Descarta o que sobrou do teste anterior que usou a mesma sessão
+                driver.get_log("browser")
+                if self.network:
+                    PerformanceLog.attach(driver).start()
+            except WebDriverException:
+                pass
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        driver = item.funcargs.get("driver")
+        if call.when != "call" or driver is None:
+            return
+        if not report.failed and random.random() >= self.sample_rate:
+            return
+        directory = os.path.join(self.output_dir, re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_"))
+        paths = []
+        for name, data in capture(driver, network=self.network):
+            path = os.path.join(directory, name if name.endswith(".png") else name + ".gz")
+            self.writer.submit(path, data)
+            paths.append(path)
+        report.user_properties.append(("artifacts", paths))
+
+        if paths:
+            # Links relativos ao diretório do relatório
+            report_dir = os.path.dirname(os.path.abspath(item.config.getoption("htmlpath", None) or "report.html"))
+            links = " | ".join(
+                f'<a href="{os.path.relpath(os.path.abspath(path), report_dir)}">{os.path.basename(path)}</a>'
+                for path in paths
+            )
+            add_html_extra(item, report, f"<p><b>Artefatos:</b> {links}</p>")
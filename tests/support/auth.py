@@ -0,0 +1,161 @@
+"""
+Reaproveitamento do estado autenticado.
+O login real pela interface acontece uma vez por worker: os cookies
+resultantes (inclusive HttpOnly), o localStorage e o sessionStorage da
+origem são guardados em um snapshot. As sessões seguintes recebem o snapshot
+em um passo, antes de a página carregar: os cookies com `Network.setCookies`
+e o armazenamento com um script registrado por
+`Page.addScriptToEvaluateOnNewDocument`, executado antes dos scripts da
+página. O snapshot é refeito com um novo login quando expira ou quando o
+servidor o rejeita (a página autenticada volta para a tela de login).
+"""
+import json
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.pages.login_page import LoginPage
+
+
+# Campos de Network.Cookie aceitos por Network.setCookies (CookieParam)
+_COOKIE_PARAMS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority")
+
+_READ_STORAGE_SCRIPT = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+return {origin: location.origin, local: dump(localStorage), session: dump(sessionStorage)};
+"""
+
+# Executado em cada novo documento enquanto registrado; só escreve na origem do snapshot
+_RESTORE_STORAGE_SCRIPT = """
+(function (snapshot) {
+    if (location.origin !== snapshot.origin) { return; }
+    Object.keys(snapshot.local).forEach(function (key) { localStorage.setItem(key, snapshot.local[key]); });
+    Object.keys(snapshot.session).forEach(function (key) { sessionStorage.setItem(key, snapshot.session[key]); });
+})(%s);
+"""
+
+# Caminho da página carregada e presença do formulário de login, em uma chamada
+_LANDING_STATE_SCRIPT = "return [location.pathname, document.getElementById(arguments[0]) !== null];"
+
+
+@dataclass
+class AuthSnapshot:
+    """Cookies e armazenamento de uma sessão autenticada, com o instante de expiração (epoch)."""
+
+    origin: str
+    cookies: list
+    local_storage: dict
+    session_storage: dict
+    captured_at: float = field(default_factory=time.time)
+    expires_at: float = None
+
+    def expired(self, margin=0):
+        return self.expires_at is not None and time.time() + margin >= self.expires_at
+
+    def cookie_params(self):
+        params = []
+        for cookie in self.cookies:
+            param = {name: cookie[name] for name in _COOKIE_PARAMS if name in cookie}
+            if cookie.get("session") or param.get("expires", -1) < 0:
+                param.pop("expires", None)  # Cookie de sessão do navegador
+            params.append(param)
+        return params
+
+    def storage_script(self):
+        return _RESTORE_STORAGE_SCRIPT % json.dumps(
+            {"origin": self.origin, "local": self.local_storage, "session": self.session_storage}
+        )
+
+
+def capture_snapshot(driver):
+    """Lê os cookies e o armazenamento da página atual do driver."""
+    cookies = driver.execute_cdp_cmd("Network.getCookies", {})["cookies"]
+    storage = driver.execute_script(_READ_STORAGE_SCRIPT)
+    persistent = [cookie["expires"] for cookie in cookies if not cookie.get("session") and cookie.get("expires", -1) > 0]
+    return AuthSnapshot(
+        origin=storage["origin"],
+        cookies=cookies,
+        local_storage=storage["local"],
+        session_storage=storage["session"],
+        expires_at=min(persistent) if persistent else None,
+    )
+
+
+class AuthState:
+    """
+    Estado autenticado compartilhado pelos testes de um worker.
+
+    `open` leva o driver a uma página autenticada injetando o snapshot; o
+    login real pela interface só acontece na primeira vez, quando o snapshot
+    expira (com `expiry_margin` segundos de folga) ou quando é rejeitado.
+    """
+
+    def __init__(self, base_url, credentials, landing_path="/dashboard", expiry_margin=60, timeout=10):
+        self.base_url = base_url
+        self.credentials = credentials
+        self.landing_path = landing_path
+        self.expiry_margin = expiry_margin
+        self.timeout = timeout
+        self.snapshot = None
+        self.logins = 0
+        self.restores = 0
+
+    def open(self, driver, path=None):
+        """Abre `path` (padrão: página pós-login) autenticado, refazendo o login se necessário."""
+        path = path or self.landing_path
+        if self.snapshot is None or self.snapshot.expired(self.expiry_margin):
+            self.refresh(driver)
+            if path == self.landing_path and self._on_page(driver, path):
+                return driver  # O próprio login já terminou na página pedida
+        if self._restore(driver, path):
+            return driver
+        # Sessão revogada ou expirada no servidor antes do prazo do cookie
+        self.refresh(driver)
+        if not self._restore(driver, path):
+            raise RuntimeError(f"Estado autenticado rejeitado em {path} mesmo após um novo login")
+        return driver
+
+    def refresh(self, driver):
+        """Faz o login real pela interface e guarda um novo snapshot."""
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        page = LoginPage(driver).open(self.base_url, timeout=self.timeout)
+        page.fill_email(self.credentials["email"])
+        page.fill_password(self.credentials["password"])
+        page.submit()
+        WebDriverWait(driver, self.timeout).until(lambda d: self._landing_state(d)[0] == self.landing_path)
+        self.snapshot = capture_snapshot(driver)
+        self.logins += 1
+        return self.snapshot
+
+    def _restore(self, driver, path):
+        """Injeta o snapshot e navega para `path`; retorna False se o servidor recusar a sessão."""
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": self.snapshot.cookie_params()})
+        script = driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": self.snapshot.storage_script()}
+        )["identifier"]
+        try:
+            driver.get(urljoin(self.base_url, path))
+        finally:
+            # Não vaza o estado para as próximas navegações (nem para o próximo teste da sessão do pool)
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script})
+        accepted = self._on_page(driver, path)
+        self.restores += accepted
+        return accepted
+
+    def _on_page(self, driver, path):
+        """A página atual é `path` e não exibe o formulário de login."""
+        pathname, login_form = self._landing_state(driver)
+        return pathname == path and not login_form
+
+    @staticmethod
+    def _landing_state(driver):
+        return driver.execute_script(_LANDING_STATE_SCRIPT, LoginPage.PASSWORD_INPUT_ID)
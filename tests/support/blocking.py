@@ -0,0 +1,166 @@
+"""
+Bloqueio de recursos não essenciais durante os testes de login.
+Imagens, fontes, mídia, analytics e scripts de terceiros são bloqueados via
+`Network.setBlockedURLs` do DevTools Protocol, e o log de desempenho
+contabiliza por teste as requisições bloqueadas, os bytes economizados e os
+bytes efetivamente transferidos.
+
+Como o chromedriver não entrega eventos do protocolo para interceptação
+(Fetch.requestPaused), a página é carregada uma vez sem bloqueio por worker
+(calibração, na fixture de sessão `resource_blocking`, fora da fase de
+execução dos testes): as URLs observadas, com tipo e tamanho, definem a lista
+exata de bloqueio, respeitando os padrões de permissão, e servem de base para
+estimar os bytes economizados.
+"""
+import re
+from dataclasses import dataclass, field
+
+import pytest
+
+from tests.support.perflog import PerformanceLog
+from tests.support.reporting import add_html_extra
+
+
+# Padrões por tipo de recurso, usados para URLs não vistas na calibração
+TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav"],
+    "stylesheet": ["*.css"],
+}
+
+_STATS_KEY = pytest.StashKey[dict]()
+
+
+def glob_match(pattern, url):
+    """Compara a URL com um padrão em que apenas `*` é curinga (mesma semântica do Chrome)."""
+    regex = ".*".join(re.escape(part) for part in pattern.split("*"))
+    return re.fullmatch(regex, url) is not None
+
+
+def _with_query(patterns):
+    return patterns + [pattern + "?*" for pattern in patterns]
+
+
+@dataclass
+class ResourceBlocker:
+    """
+    Regras de bloqueio: tipos de recurso e padrões de URL negados e padrões
+    permitidos. Permissões têm prioridade sobre os tipos negados; os padrões
+    de URL negados são sempre aplicados.
+    """
+
+    deny_types: list
+    deny_patterns: list
+    allow_patterns: list = field(default_factory=list)
+    calibrated: dict = field(default_factory=dict)
+
+    def is_allowed(self, url):
+        return any(glob_match(pattern, url) for pattern in self.allow_patterns)
+
+    def should_block(self, url, resource_type):
+        if any(glob_match(pattern, url) for pattern in self.deny_patterns):
+            return True
+        return resource_type in self.deny_types and not self.is_allowed(url)
+
+    def calibrate(self, driver, url):
+        """Carrega a página sem bloqueio e registra URL, tipo e tamanho de cada recurso."""
+        log = PerformanceLog.attach(driver)
+        log.start()
+        driver.get(url)
+        log.collect()
+        requests = {}
+        for event in log.network_events("Network.requestWillBeSent", "Network.loadingFinished"):
+            params = event["params"]
+            if event["method"] == "Network.requestWillBeSent":
+                requests[params["requestId"]] = (params["request"]["url"], (params.get("type") or "other").lower())
+            elif params["requestId"] in requests:
+                request_url, resource_type = requests[params["requestId"]]
+                self.calibrated[request_url] = {"type": resource_type, "bytes": params.get("encodedDataLength", 0)}
+
+    def blocked_urls(self):
+        """Lista enviada ao Chrome: URLs calibradas a bloquear, padrões por tipo e padrões negados."""
+        urls = sorted(url for url, info in self.calibrated.items() if self.should_block(url, info["type"]))
+        if not self.allow_patterns:
+            # Sem permissões, os padrões por tipo cobrem também URLs não vistas na calibração
+            for resource_type in self.deny_types:
+                urls += _with_query(TYPE_PATTERNS.get(resource_type, []))
+        return urls + list(self.deny_patterns)
+
+    def apply(self, driver):
+        """Ativa o bloqueio na sessão (uma vez por sessão)."""
+        if getattr(driver, "_qa_blocking_applied", False):
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls()})
+        driver._qa_blocking_applied = True
+
+    def stats(self, log):
+        """Requisições bloqueadas, bytes economizados (estimados pela calibração) e bytes transferidos."""
+        urls = {}
+        blocked = 0
+        saved = 0
+        transferred = 0
+        for event in log.network_events("Network.requestWillBeSent", "Network.loadingFailed", "Network.loadingFinished"):
+            params = event["params"]
+            if event["method"] == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif event["method"] == "Network.loadingFailed":
+                if params.get("blockedReason"):
+                    blocked += 1
+                    saved += self.calibrated.get(urls.get(params["requestId"]), {}).get("bytes", 0)
+            else:
+                transferred += params.get("encodedDataLength", 0)
+        return {"blocked_requests": blocked, "saved_bytes": saved, "transferred_bytes": transferred}
+
+
+class ResourceBlockingPlugin:
+    """Aplica o bloqueio às sessões dos testes e reporta as estatísticas por teste e da execução."""
+
+    def __init__(self, blocker):
+        self.blocker = blocker
+        self.totals = {"blocked_requests": 0, "saved_bytes": 0, "transferred_bytes": 0}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        # A calibração já foi feita pela fixture `resource_blocking`, requisitada pela fixture `driver`
+        driver = item.funcargs.get("driver")
+        log = None
+        if driver is not None:
+            self.blocker.apply(driver)
+            log = PerformanceLog.attach(driver)
+            log.start()
+        yield
+        if log is not None:
+            log.collect()
+            item.stash[_STATS_KEY] = self.blocker.stats(log)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        stats = item.stash.get(_STATS_KEY, None)
+        if call.when != "call" or stats is None:
+            return
+        report = outcome.get_result()
+        report.user_properties.append(("resource_blocking", stats))
+        add_html_extra(
+            item,
+            report,
+            f"<p><b>Recursos bloqueados:</b> {stats['blocked_requests']} requisições, "
+            f"{stats['saved_bytes'] / 1024:.1f} KiB economizados, "
+            f"{stats['transferred_bytes'] / 1024:.1f} KiB transferidos</p>",
+        )
+
+    def pytest_runtest_logreport(self, report):
+        for name, value in report.user_properties:
+            if name == "resource_blocking":
+                for key in self.totals:
+                    self.totals[key] += value[key]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.section("bloqueio de recursos")
+        terminalreporter.write_line(
+            f"{self.totals['blocked_requests']} requisições bloqueadas, "
+            f"{self.totals['saved_bytes'] / 1024:.1f} KiB economizados, "
+            f"{self.totals['transferred_bytes'] / 1024:.1f} KiB transferidos"
+        )
@@ -0,0 +1,52 @@
+"""
+Criação de sessões do Chrome isoladas entre si.
+Cada sessão recebe porta de depuração, porta do chromedriver e diretório de
+perfil próprios, permitindo várias instâncias do Chrome no mesmo host.
+"""
+import os
+import shutil
+import socket
+import tempfile
+
+from selenium import webdriver
+
+from tests.support.profile import copy_profile
+
+
+def free_port():
+    """Retorna uma porta TCP livre em localhost."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def worker_id():
+    """Identificador do worker do pytest-xdist ("master" quando não há paralelismo)."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+class IsolatedChrome(webdriver.Chrome):
+    """
+    Chrome com diretório de perfil temporário e portas exclusivas.
+    O perfil pode partir de uma cópia de `profile_template` e ser criado em
+    `profile_root` (ex.: tmpfs); é removido quando a sessão é finalizada.
+    """
+
+    def __init__(self, options, service, profile_template=None, profile_root=None):
+        self.debugging_port = free_port()
+        self.profile_dir = tempfile.mkdtemp(prefix=f"qa-chrome-{worker_id()}-", dir=profile_root)
+        options.add_argument(f"--remote-debugging-port={self.debugging_port}")
+        options.add_argument(f"--user-data-dir={self.profile_dir}")
+        try:
+            if profile_template is not None:
+                copy_profile(profile_template, self.profile_dir)
+            super().__init__(service=service, options=options)
+        except Exception:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            raise
+
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
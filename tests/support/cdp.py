@@ -0,0 +1,576 @@
+"""
+Backend alternativo do driver: fala com a página diretamente pelo DevTools
+Protocol (CDP) em um WebSocket persistente, sem passar pelo chromedriver.
+
+O cliente é assíncrono (asyncio, pacote opcional `websockets`) e roda em uma
+thread própria; `CdpDriver` é a fachada síncrona usada pelos testes, com a
+mesma superfície que os helpers usam do WebDriver (get, find_element(s),
+execute_script, execute_async_script, current_url, elementos com send_keys,
+click, clear, get_attribute, text, is_displayed, ...). O restante (janelas,
+logs, execute_cdp_cmd, ...) continua indo para a sessão do WebDriver.
+
+- Comandos independentes são enviados em sequência sem esperar cada resposta
+  (pipelining): os eventos de teclado de um `send_keys` e os de mouse de um
+  `click` custam uma única ida e volta.
+- A navegação termina pelo evento `Page.loadEventFired`, recebido por push,
+  em vez de consultar o estado da página.
+
+Os elementos são referenciados por um registro criado no próprio documento;
+uma referência de outro documento (após navegação) ou de um nó removido gera
+StaleElementReferenceException, como no WebDriver.
+"""
+import asyncio
+import base64
+import itertools
+import json
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+try:
+    import websockets
+except ImportError:  # Dependência opcional, necessária apenas com --driver-backend cdp
+    websockets = None
+
+from tests.support.network import SCRIPT_TIMEOUT
+
+
+WEBDRIVER = "webdriver"
+CDP = "cdp"
+DRIVER_BACKENDS = (WEBDRIVER, CDP)
+
+PAGE_LOAD_TIMEOUT = 60
+
+# Nome do comando de execute_async_script no rastreamento (bloqueia aguardando a página)
+AWAIT_PROMISE_COMMAND = "Runtime.evaluate(awaitPromise)"
+
+# Registro de nós do documento: converte nós em referências {__qa_node__, doc} e vice-versa
+_RUNTIME_SCRIPT = """
+if (!window.__qaCdp) {
+    (function () {
+        var nodes = new Map(), ids = new WeakMap(), next = 1;
+        var doc = Math.random().toString(36).slice(2) + Date.now().toString(36);
+        function wrap(value) {
+            if (value instanceof Node) {
+                var id = ids.get(value);
+                if (!id) { id = next++; ids.set(value, id); nodes.set(id, value); }
+                return {__qa_node__: id, doc: doc};
+            }
+            if (Array.isArray(value) || value instanceof NodeList || value instanceof HTMLCollection) {
+                return Array.prototype.map.call(value, wrap);
+            }
+            if (value && typeof value === 'object' && Object.getPrototypeOf(value) === Object.prototype) {
+                var out = {};
+                Object.keys(value).forEach(function (key) { out[key] = wrap(value[key]); });
+                return out;
+            }
+            return value === undefined ? null : value;
+        }
+        function unwrap(value) {
+            if (Array.isArray(value)) { return value.map(unwrap); }
+            if (value && typeof value === 'object') {
+                if ('__qa_node__' in value) {
+                    var node = value.doc === doc ? nodes.get(value.__qa_node__) : null;
+                    if (!node || !node.isConnected) { throw new Error('qa-stale-element'); }
+                    return node;
+                }
+                var out = {};
+                Object.keys(value).forEach(function (key) { out[key] = unwrap(value[key]); });
+                return out;
+            }
+            return value;
+        }
+        Object.defineProperty(window, '__qaCdp', {value: {wrap: wrap, unwrap: unwrap}});
+    })();
+}
+"""
+
+_FIND_SCRIPT = """
+var using = arguments[0], value = arguments[1], root = arguments[2] || document, single = arguments[3];
+var found;
+if (using === 'xpath') {
+    var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    found = [];
+    for (var i = 0; i < snapshot.snapshotLength && !(single && found.length); i++) { found.push(snapshot.snapshotItem(i)); }
+} else if (using === 'link text' || using === 'partial link text') {
+    found = Array.prototype.filter.call(root.querySelectorAll('a'), function (a) {
+        var text = a.innerText.trim();
+        return using === 'link text' ? text === value : text.indexOf(value) !== -1;
+    });
+} else if (single) {
+    var element = root.querySelector(value);
+    found = element ? [element] : [];
+} else {
+    found = root.querySelectorAll(value);
+}
+return found;
+"""
+
+_FOCUS_SCRIPT = """
+var el = arguments[0];
+el.focus();
+try { var end = el.value.length; el.setSelectionRange(end, end); } catch (e) {}
+"""
+
+_CLICK_POINT_SCRIPT = """
+var el = arguments[0];
+el.scrollIntoView({block: 'center', inline: 'center'});
+var rect = el.getBoundingClientRect();
+return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2, width: rect.width, height: rect.height};
+"""
+
+_CLEAR_SCRIPT = """
+var el = arguments[0];
+el.focus();
+el.value = '';
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Mesma regra do WebDriver: propriedade quando existir (booleanos viram "true"/None), senão o atributo
+_ATTRIBUTE_SCRIPT = """
+var el = arguments[0], name = arguments[1], prop = el[name];
+if (typeof prop === 'boolean') { return prop ? 'true' : null; }
+if (prop !== undefined && prop !== null && typeof prop !== 'object' && typeof prop !== 'function') { return String(prop); }
+return el.getAttribute(name);
+"""
+
+_DISPLAYED_SCRIPT = """
+var el = arguments[0];
+if (!el.isConnected || !el.getClientRects().length) { return false; }
+for (var node = el; node && node.nodeType === 1; node = node.parentElement) {
+    var style = getComputedStyle(node);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') { return false; }
+}
+return true;
+"""
+
+# Teclas especiais do Selenium: (key, code, keyCode do Windows, texto inserido)
+_SPECIAL_KEYS = {
+    Keys.ENTER: ("Enter", "Enter", 13, "\r"),
+    Keys.RETURN: ("Enter", "Enter", 13, "\r"),
+    Keys.TAB: ("Tab", "Tab", 9, ""),
+    Keys.BACKSPACE: ("Backspace", "Backspace", 8, ""),
+    Keys.DELETE: ("Delete", "Delete", 46, ""),
+    Keys.ESCAPE: ("Escape", "Escape", 27, ""),
+}
+
+
+class CdpError(WebDriverException):
+    """Erro devolvido pelo navegador a um comando do DevTools Protocol."""
+
+
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _loop():
+    """Loop de eventos compartilhado pelas conexões CDP do processo, em uma thread própria."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="qa-cdp", daemon=True).start()
+    return _LOOP
+
+
+def _run(coro):
+    return asyncio.run_coroutine_threadsafe(coro, _loop()).result()
+
+
+class CdpConnection:
+    """Conexão assíncrona com um alvo do DevTools: comandos com id, respostas e eventos por push."""
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = set()
+        self.latencies = defaultdict(list)
+        self.closed = False
+        self._reader = asyncio.get_running_loop().create_task(self._read())
+
+    @classmethod
+    async def open(cls, url):
+        websocket = await websockets.connect(url, max_size=None, ping_interval=None)
+        return cls(websocket)
+
+    async def send(self, method, params=None):
+        """Envia o comando sem aguardar a resposta e retorna o future do resultado (pipelining)."""
+        future = asyncio.get_running_loop().create_future()
+        if self.closed:
+            future.set_exception(WebDriverException(f"Conexão CDP encerrada antes de {method}"))
+            return future
+        command_id = next(self._ids)
+        self._pending[command_id] = (future, method, time.perf_counter())
+        # Cancelado pelo chamador (timeout do asyncio.wait_for): a resposta pode nunca chegar
+        future.add_done_callback(lambda f: f.cancelled() and self._pending.pop(command_id, None))
+        await self._websocket.send(json.dumps({"id": command_id, "method": method, "params": params or {}}))
+        return future
+
+    async def call(self, method, params=None):
+        """Envia o comando e aguarda o resultado."""
+        return await (await self.send(method, params))
+
+    async def pipeline(self, commands):
+        """Envia todos os comandos de uma vez e aguarda as respostas: uma única ida e volta."""
+        futures = [await self.send(method, params) for method, params in commands]
+        return await asyncio.gather(*futures)
+
+    def expect(self, method):
+        """Future resolvido pelo próximo evento `method`; registre-o antes de disparar a ação."""
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(name, params):
+            if name == method and not future.done():
+                future.set_result(params)
+
+        self._listeners.add(listener)
+        future.add_done_callback(lambda _: self._listeners.discard(listener))
+        return future
+
+    async def close(self):
+        await self._websocket.close()
+        await self._reader
+
+    async def _read(self):
+        try:
+            async for message in self._websocket:
+                data = json.loads(message)
+                if "id" not in data:
+                    for listener in list(self._listeners):
+                        listener(data.get("method"), data.get("params", {}))
+                    continue
+                future, method, started = self._pending.pop(data["id"], (None, None, None))
+                if future is None or future.done():
+                    continue
+                self.latencies[method].append((time.perf_counter() - started) * 1000)
+                if "error" in data:
+                    future.set_exception(CdpError(f"{method}: {data['error'].get('message', '')}"))
+                else:
+                    future.set_result(data.get("result", {}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.closed = True
+            for future, method, _ in self._pending.values():
+                if not future.done():
+                    future.set_exception(WebDriverException(f"Conexão CDP encerrada durante {method}"))
+            self._pending.clear()
+
+
+def _css_locator(by, value):
+    """Converte os localizadores como o próprio Selenium faz antes de enviá-los ao navegador."""
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    return by, value
+
+
+class CdpElement:
+    """Elemento da página referenciado pelo registro de nós do documento."""
+
+    def __init__(self, parent, reference):
+        self.parent = parent
+        self._reference = reference
+
+    @property
+    def id(self):
+        return f"{self._reference['doc']}:{self._reference['__qa_node__']}"
+
+    def __eq__(self, other):
+        return isinstance(other, CdpElement) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"<CdpElement {self.id}>"
+
+    def _script(self, script, *args):
+        return self.parent.execute_script(script, self, *args)
+
+    @property
+    def text(self):
+        return self._script("return arguments[0].innerText.trim();")
+
+    @property
+    def tag_name(self):
+        return self._script("return arguments[0].tagName.toLowerCase();")
+
+    def get_attribute(self, name):
+        return self._script(_ATTRIBUTE_SCRIPT, name)
+
+    def get_dom_attribute(self, name):
+        return self._script("return arguments[0].getAttribute(arguments[1]);", name)
+
+    def get_property(self, name):
+        return self._script("return arguments[0][arguments[1]];", name)
+
+    def is_displayed(self):
+        return self._script(_DISPLAYED_SCRIPT)
+
+    def is_enabled(self):
+        return self._script("return !arguments[0].disabled;")
+
+    def is_selected(self):
+        return self._script("return !!(arguments[0].checked || arguments[0].selected);")
+
+    def clear(self):
+        self._script(_CLEAR_SCRIPT)
+
+    def send_keys(self, *value):
+        self._script(_FOCUS_SCRIPT)
+        self.parent._type("".join(str(part) for part in value))
+
+    def click(self):
+        point = self._script(_CLICK_POINT_SCRIPT)
+        if not point["width"] or not point["height"]:
+            raise ElementNotInteractableException(f"Elemento sem área visível para o clique: {self!r}")
+        self.parent._click(point["x"], point["y"])
+
+    def submit(self):
+        self._script("var form = arguments[0].form || arguments[0]; form.requestSubmit ? form.requestSubmit() : form.submit();")
+
+    def find_element(self, by=By.ID, value=None):
+        return self.parent._find(by, value, root=self, single=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.parent._find(by, value, root=self, single=False)
+
+
+class CdpDriver:
+    """
+    Fachada síncrona do backend CDP sobre uma sessão do WebDriver.
+    Atributos não implementados aqui são delegados ao WebDriver original.
+
+    Os comandos da fachada passam por `command_hook(method, run)` quando ele
+    está definido (usado pelo rastreamento de comandos por teste); os
+    delegados ao WebDriver continuam passando pelo `command_executor`.
+    """
+
+    command_hook = None
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._script_timeout = SCRIPT_TIMEOUT
+        # No chromedriver o identificador da janela é o id do alvo do DevTools
+        address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        url = f"ws://{address}/devtools/page/{driver.current_window_handle}"
+        self._connection = _run(CdpConnection.open(url))
+        _run(self._connection.call("Page.enable"))
+
+    @classmethod
+    def attach(cls, driver):
+        """Retorna a fachada CDP do driver, abrindo a conexão na primeira chamada (ou se ela caiu)."""
+        facade = getattr(driver, "_qa_cdp", None)
+        if facade is None or facade._connection.closed:
+            facade = cls(driver)
+            driver._qa_cdp = facade
+        return facade
+
+    def __getattr__(self, name):
+        if name == "_driver":
+            raise AttributeError(name)
+        return getattr(self._driver, name)
+
+    @property
+    def backend(self):
+        return CDP
+
+    @property
+    def webdriver(self):
+        """Sessão do WebDriver por trás da fachada."""
+        return self._driver
+
+    def _call(self, method, coro):
+        """Executa um comando da fachada (uma ida e volta) no loop do CDP."""
+        if self.command_hook is None:
+            return _run(coro)
+        return self.command_hook(method, lambda: _run(coro))
+
+    def command_latencies(self):
+        """Latências (ms) de cada método do protocolo enviados por esta conexão."""
+        return {method: list(values) for method, values in self._connection.latencies.items()}
+
+    # ---- navegação ----
+
+    def get(self, url):
+        self._call("Page.navigate", self._navigate("Page.navigate", {"url": url}))
+
+    def refresh(self):
+        self._call("Page.reload", self._navigate("Page.reload", {}))
+
+    async def _navigate(self, method, params):
+        loaded = self._connection.expect("Page.loadEventFired")
+        try:
+            result = await self._connection.call(method, params)
+        except BaseException:
+            loaded.cancel()
+            raise
+        if result.get("errorText"):
+            loaded.cancel()
+            raise WebDriverException(f"Falha ao navegar para {params.get('url')}: {result['errorText']}")
+        if method == "Page.navigate" and not result.get("loaderId"):
+            loaded.cancel()  # Navegação dentro do mesmo documento (âncora): não há evento load
+            return
+        try:
+            await asyncio.wait_for(loaded, PAGE_LOAD_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"A página não terminou de carregar em {PAGE_LOAD_TIMEOUT}s")
+
+    @property
+    def current_url(self):
+        return self.execute_script("return location.href;")
+
+    @property
+    def title(self):
+        return self.execute_script("return document.title;")
+
+    @property
+    def page_source(self):
+        return self.execute_script("return document.documentElement.outerHTML;")
+
+    def get_screenshot_as_png(self):
+        result = self._call("Page.captureScreenshot", self._connection.call("Page.captureScreenshot", {"format": "png"}))
+        return base64.b64decode(result["data"])
+
+    # ---- scripts ----
+
+    def set_script_timeout(self, time_to_wait):
+        self._script_timeout = time_to_wait
+        self._driver.set_script_timeout(time_to_wait)
+
+    def execute_script(self, script, *args):
+        expression = (
+            "(function () {" + _RUNTIME_SCRIPT + "var qa = window.__qaCdp, args = qa.unwrap("
+            + json.dumps(self._references(args)) + ");"
+            + "return qa.wrap((function () {\n" + script + "\n}).apply(null, args)); })()"
+        )
+        return self._call("Runtime.evaluate", self._evaluate(expression, await_promise=False))
+
+    def execute_async_script(self, script, *args):
+        expression = (
+            "(function () {" + _RUNTIME_SCRIPT + "var qa = window.__qaCdp, args = qa.unwrap("
+            + json.dumps(self._references(args)) + ");"
+            + "return new Promise(function (resolve, reject) {"
+            + "args.push(function (value) { resolve(qa.wrap(value)); });"
+            + "try { (function () {\n" + script + "\n}).apply(null, args); } catch (e) { reject(e); } }); })()"
+        )
+        return self._call(AWAIT_PROMISE_COMMAND, self._evaluate(expression, await_promise=True))
+
+    async def _evaluate(self, expression, await_promise):
+        call = self._connection.call("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": await_promise,
+            "userGesture": True,
+        })
+        try:
+            result = await (asyncio.wait_for(call, self._script_timeout) if await_promise else call)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"O script assíncrono não terminou em {self._script_timeout}s")
+        details = result.get("exceptionDetails")
+        if details:
+            message = (details.get("exception") or {}).get("description") or details.get("text", "")
+            if "qa-stale-element" in message:
+                raise StaleElementReferenceException("O elemento não está mais anexado ao documento")
+            raise JavascriptException(message)
+        return self._elements(result["result"].get("value"))
+
+    def _references(self, value):
+        if isinstance(value, CdpElement):
+            return value._reference
+        if isinstance(value, (list, tuple)):
+            return [self._references(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._references(item) for key, item in value.items()}
+        return value
+
+    def _elements(self, value):
+        if isinstance(value, list):
+            return [self._elements(item) for item in value]
+        if isinstance(value, dict):
+            if "__qa_node__" in value:
+                return CdpElement(self, value)
+            return {key: self._elements(item) for key, item in value.items()}
+        return value
+
+    # ---- elementos ----
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find(by, value, root=None, single=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find(by, value, root=None, single=False)
+
+    def _find(self, by, value, root, single):
+        using, selector = _css_locator(by, value)
+        found = self.execute_script(_FIND_SCRIPT, using, selector, root, single)
+        if not single:
+            return found
+        if not found:
+            raise NoSuchElementException(f"Elemento não encontrado: {by}={value!r}")
+        return found[0]
+
+    def _type(self, text):
+        """Digita o texto no elemento com foco: todos os eventos de teclado em uma única ida e volta."""
+        events = []
+        for char in text:
+            if char in _SPECIAL_KEYS:
+                key, code, key_code, inserted = _SPECIAL_KEYS[char]
+                down = {"type": "keyDown", "key": key, "code": code, "windowsVirtualKeyCode": key_code}
+                if inserted:
+                    down["text"] = inserted
+                events.append(down)
+                events.append({"type": "keyUp", "key": key, "code": code, "windowsVirtualKeyCode": key_code})
+            else:
+                events.append({"type": "keyDown", "key": char, "text": char, "unmodifiedText": char})
+                events.append({"type": "keyUp", "key": char})
+        if events:
+            self._call("Input.dispatchKeyEvent", self._connection.pipeline([("Input.dispatchKeyEvent", event) for event in events]))
+
+    def _click(self, x, y):
+        """Move, pressiona e solta o botão esquerdo no ponto informado, em uma única ida e volta."""
+        events = [
+            {"type": "mouseMoved", "x": x, "y": y},
+            {"type": "mousePressed", "x": x, "y": y, "button": "left", "clickCount": 1},
+            {"type": "mouseReleased", "x": x, "y": y, "button": "left", "clickCount": 1},
+        ]
+        self._call("Input.dispatchMouseEvent", self._connection.pipeline([("Input.dispatchMouseEvent", event) for event in events]))
+
+    def quit(self):
+        if not self._connection.closed:
+            try:
+                _run(self._connection.close())
+            except Exception:
+                pass
+        self._driver.quit()
+
+
+def require_backend(backend):
+    """Falha cedo, com a instrução de instalação, se a dependência do backend não estiver disponível."""
+    if backend == CDP and websockets is None:
+        raise pytest.UsageError("--driver-backend cdp requer o pacote websockets: pip install websockets")
+
+
+def wrap_driver(driver, backend):
+    """Driver a entregar aos testes conforme o backend escolhido."""
+    return CdpDriver.attach(driver) if backend == CDP else driver
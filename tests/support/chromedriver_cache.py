@@ -0,0 +1,145 @@
+"""
+Cache persistente da resolução do ChromeDriver.
+O caminho resolvido é guardado em disco junto com a impressão digital do
+Chrome instalado (caminho, tamanho e data de modificação do binário) e o hash
+do chromedriver. Execuções seguintes reutilizam o caminho sem consultar o
+webdriver-manager nem a rede; uma atualização do Chrome invalida a entrada.
+Sem um Chrome localizável não há como detectar atualizações, e a resolução
+não é gravada em disco.
+"""
+import hashlib
+import json
+import os
+import platform
+import shutil
+import tempfile
+from pathlib import Path
+
+
+CACHE_DIR = Path(os.environ.get("QA_CACHE_DIR", Path.home() / ".cache" / "qa-university-presence"))
+CACHE_FILE = CACHE_DIR / "chromedriver.json"
+
+# Nomes/caminhos usuais do binário do Chrome por sistema operacional
+_CHROME_CANDIDATES = {
+    "linux": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"],
+    "darwin": [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+    ],
+    "windows": [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    ],
+}
+
+# Resolução memorizada durante a sessão do pytest
+_session_path = None
+
+
+def find_chrome_binary():
+    """Localiza o binário do Chrome instalado (CHROME_BINARY tem prioridade)."""
+    candidates = [os.environ.get("CHROME_BINARY")] + _CHROME_CANDIDATES.get(platform.system().lower(), [])
+    for candidate in filter(None, candidates):
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.exists(path):
+            return os.path.realpath(path)
+    return None
+
+
+def chrome_fingerprint():
+    """
+    Identifica a instalação do Chrome sem iniciar processos.
+    Qualquer atualização altera tamanho ou data de modificação do binário.
+    Retorna None se o Chrome não for encontrado.
+    """
+    binary = find_chrome_binary()
+    if binary is None:
+        return None
+    stat = os.stat(binary)
+    return f"chrome:{binary}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def file_sha256(path):
+    """Hash SHA-256 do arquivo."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_entry():
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_entry(entry):
+    # Escrita atômica: workers paralelos podem gravar ao mesmo tempo
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=".chromedriver-", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_path, CACHE_FILE)
+
+
+def _entry_is_valid(entry, fingerprint):
+    """Confere a entrada do cache contra o Chrome instalado e o binário do driver."""
+    if not entry or entry.get("chrome") != fingerprint:
+        return False
+    driver_path = entry.get("path")
+    if not driver_path or not os.path.exists(driver_path):
+        return False
+    stat = os.stat(driver_path)
+    if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+        return True
+    # O binário mudou de data/tamanho: só aceita se o conteúdo for o mesmo
+    if file_sha256(driver_path) != entry.get("sha256"):
+        return False
+    # Guarda a nova data/tamanho para não recalcular o hash nas próximas execuções
+    entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    try:
+        _store_entry(entry)
+    except OSError:
+        pass
+    return True
+
+
+def cached_chromedriver_path(resolve):
+    """
+    Retorna o caminho do ChromeDriver, chamando `resolve()` apenas quando não
+    houver entrada válida no cache (memória da sessão ou disco).
+    """
+    global _session_path
+    if _session_path is not None:
+        return _session_path
+
+    fingerprint = chrome_fingerprint()
+    if fingerprint is None:
+        # Sem o Chrome não há como invalidar a entrada em uma atualização
+        _session_path = resolve() or None
+        return _session_path
+
+    entry = _load_entry()
+    if _entry_is_valid(entry, fingerprint):
+        _session_path = entry["path"]
+        return _session_path
+
+    driver_path = resolve()
+    if not driver_path:
+        return driver_path
+    stat = os.stat(driver_path)
+    try:
+        _store_entry({
+            "chrome": fingerprint,
+            "path": driver_path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_sha256(driver_path),
+        })
+    except OSError:
+        pass  # Sem permissão de escrita: segue apenas com o cache da sessão
+    _session_path = driver_path
+    return _session_path
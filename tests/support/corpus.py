@@ -0,0 +1,104 @@
+"""
+Leitura em streaming de corpora de credenciais (CSV/JSONL) para testes data-driven.
+Os casos são lidos sob demanda, sem duplicatas, e gravados em um arquivo
+temporário indexado por lote: cada teste lê apenas o seu lote, então o corpus
+nunca fica inteiro em memória (apenas os hashes de 8 bytes usados na
+remoção de duplicatas).
+
+Formato dos casos: campos `email`, `password`, `expected` ("rejected", padrão,
+ou "accepted") e `id` (opcional). CSV com cabeçalho ou JSONL, um objeto por linha.
+"""
+import csv
+import hashlib
+import json
+import os
+import tempfile
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+
+REJECTED = "rejected"
+ACCEPTED = "accepted"
+
+CORPUS_SUFFIXES = (".csv", ".jsonl")
+
+
+def corpus_files(paths):
+    """Expande diretórios em arquivos de corpus, em ordem estável."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*") if p.suffix in CORPUS_SUFFIXES)
+        else:
+            yield path
+
+
+def _read_file(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix == ".csv":
+            for row in csv.DictReader(f):
+                yield row
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_cases(paths):
+    """Gera os casos de todos os arquivos, sob demanda e sem duplicatas (mesmo email, senha e resultado)."""
+    seen = set()
+    for path in corpus_files(paths):
+        for number, raw in enumerate(_read_file(path), start=1):
+            case = {
+                "email": raw.get("email") or "",
+                "password": raw.get("password") or "",
+                "expected": (raw.get("expected") or REJECTED).strip().lower(),
+            }
+            key = hashlib.blake2b(
+                "\0".join((case["email"], case["password"], case["expected"])).encode("utf-8"),
+                digest_size=8,
+            ).digest()
+            if key in seen:
+                continue
+            seen.add(key)
+            case["id"] = raw.get("id") or f"{path.name}:{number}"
+            yield case
+
+
+class CorpusIndex:
+    """Casos sem duplicatas gravados em disco, com o deslocamento do início de cada lote."""
+
+    def __init__(self, paths, batch_size):
+        if batch_size < 1:
+            raise ValueError(f"Tamanho de lote inválido: {batch_size} (mínimo 1)")
+        self.batch_size = batch_size
+        self.count = 0
+        self._offsets = []
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="qa-corpus-")
+        self._spool = os.path.join(self._tmpdir.name, "cases.jsonl")
+        with open(self._spool, "wb") as spool:
+            for case in iter_cases(paths):
+                if self.count % batch_size == 0:
+                    self._offsets.append(spool.tell())
+                spool.write(json.dumps(case, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.count += 1
+
+    @property
+    def batches(self):
+        return len(self._offsets)
+
+    def batch(self, index):
+        """Gera os casos do lote `index` lendo apenas o trecho correspondente do arquivo."""
+        with open(self._spool, "rb") as spool:
+            spool.seek(self._offsets[index])
+            for line in islice(spool, self.batch_size):
+                yield json.loads(line)
+
+    def close(self):
+        """Remove o arquivo temporário dos casos."""
+        self._tmpdir.cleanup()
+
+
+# Índice do corpus da execução, criado na coleta da matriz e removido ao final da sessão
+CORPUS_INDEX_KEY = pytest.StashKey[CorpusIndex]()
@@ -0,0 +1,85 @@
+"""
+Detecção de mensagens de erro na página em uma única chamada ao navegador.
+Seletores, verificação de visibilidade e busca por palavras-chave são
+avaliados dentro da página por um único `execute_script`.
+"""
+from dataclasses import dataclass
+
+
+# Seletores comuns para mensagens de erro, em ordem de prioridade
+ERROR_SELECTORS = [
+    ".error",
+    ".alert",
+    ".alert-danger",
+    ".alert-error",
+    ".invalid-feedback",
+    "[role='alert']",
+    "[data-testid='error']",
+    "[data-error]",
+    ".message-error",
+    ".error-message",
+    "div[class*='error']",
+    "span[class*='error']",
+    "p[class*='error']",
+]
+
+# Palavras que indicam erro quando a mensagem não usa classes CSS específicas
+ERROR_KEYWORDS = [
+    "erro", "error", "inválido", "invalid", "incorreto", "incorrect",
+    "falhou", "failed", "unauthorized", "não autorizado",
+]
+
+_DETECT_SCRIPT = """
+var selectors = arguments[0], keywords = arguments[1];
+function visible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+function text(el) { return (el.innerText || '').trim(); }
+
+for (var i = 0; i < selectors.length; i++) {
+    var elements;
+    try { elements = document.querySelectorAll(selectors[i]); } catch (e) { continue; }
+    for (var j = 0; j < elements.length; j++) {
+        if (visible(elements[j]) && text(elements[j])) {
+            return {kind: 'selector', match: selectors[i], text: text(elements[j])};
+        }
+    }
+}
+
+// Busca mais permissiva por palavras-chave no texto visível (pode dar falsos positivos)
+var body = document.body ? (document.body.innerText || '').toLowerCase() : '';
+for (var k = 0; k < keywords.length; k++) {
+    if (body.indexOf(keywords[k]) === -1) { continue; }
+    var found = document.evaluate("//*[contains(text(), '" + keywords[k] + "')]", document, null,
+                                  XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var n = 0; n < found.snapshotLength; n++) {
+        var node = found.snapshotItem(n);
+        if (visible(node) && text(node)) {
+            return {kind: 'keyword', match: keywords[k], text: text(node)};
+        }
+    }
+}
+return null;
+"""
+
+
+@dataclass
+class ErrorMatch:
+    """Mensagem de erro encontrada: critério que casou (seletor ou palavra-chave) e o texto exibido."""
+
+    kind: str
+    match: str
+    text: str
+
+
+def find_error_message(driver, selectors=ERROR_SELECTORS, keywords=ERROR_KEYWORDS):
+    """
+    Busca uma mensagem de erro visível na página com um único comando do WebDriver.
+    Retorna um ErrorMatch ou None se nenhuma mensagem for encontrada.
+    """
+    result = driver.execute_script(_DETECT_SCRIPT, list(selectors), list(keywords))
+    if not result:
+        return None
+    return ErrorMatch(kind=result["kind"], match=result["match"], text=result["text"])
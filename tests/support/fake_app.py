@@ -0,0 +1,285 @@
+"""
+Servidor local que substitui a aplicação de login (localhost:3001) nos testes.
+Serve a página de login (#email, #password, button[type=submit]) com seus
+recursos estáticos (logo, fonte e script de analytics), o endpoint
+POST /api/login e uma página autenticada /dashboard. Latência, variação e taxa
+de erro podem ser configuradas por endpoint, permitindo medir a própria suíte
+sem o ruído do backend real e rodar em máquinas sem rede.
+
+Uso isolado:
+    python -m tests.support.fake_app --port 3001 --profile /api/login=200:50:0.05
+"""
+import argparse
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+  <meta charset="utf-8">
+  <title>University Presence - Login</title>
+  <style>
+    @font-face { font-family: Brand; src: url(/static/brand.woff2) format('woff2'); }
+    body { font-family: Brand, sans-serif; }
+  </style>
+  <script src="/static/analytics.js" async></script>
+</head>
+<body>
+  <img src="/static/logo.png" alt="University Presence" width="160" height="48">
+  <form id="login-form" novalidate>
+    <label for="email">Email</label>
+    <input id="email" name="email" type="email" required>
+    <label for="password">Senha</label>
+    <input id="password" name="password" type="password" required>
+    <div id="feedback"></div>
+    <button type="submit">Entrar</button>
+  </form>
+  <script>
+    var form = document.getElementById('login-form');
+    form.addEventListener('submit', function (event) {
+      event.preventDefault();
+      var feedback = document.getElementById('feedback');
+      feedback.innerHTML = '';
+      if (!form.checkValidity()) {
+        form.reportValidity();
+        return;
+      }
+      fetch('/api/login', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        credentials: 'same-origin',
+        body: JSON.stringify({email: form.email.value, password: form.password.value})
+      }).then(function (response) {
+        return response.json().then(function (payload) {
+          if (response.ok) {
+            localStorage.setItem('token', payload.token);
+            sessionStorage.setItem('user', payload.email);
+            window.location.assign('/dashboard');
+            return;
+          }
+          var alert = document.createElement('div');
+          alert.className = 'alert alert-danger';
+          alert.setAttribute('role', 'alert');
+          alert.textContent = payload.message || 'Erro ao realizar login';
+          feedback.appendChild(alert);
+        });
+      }).catch(function () {
+        feedback.innerHTML = '<div class="alert alert-danger" role="alert">Erro de conexão</div>';
+      });
+    });
+  </script>
+</body>
+</html>
+"""
+
+DASHBOARD_PAGE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head><meta charset="utf-8"><title>University Presence - Painel</title></head>
+<body><main class="dashboard" data-testid="success"><h1>Bem-vindo, {email}</h1></main></body>
+</html>
+"""
+
+# Recursos que a página de login carrega mas os testes nunca verificam
+# (úteis para medir o bloqueio de recursos): caminho -> (content type, conteúdo)
+STATIC_ASSETS = {
+    "/static/logo.png": ("image/png", b"\x89PNG\r\n\x1a\n" + bytes(48 * 1024)),
+    "/static/brand.woff2": ("font/woff2", b"wOF2" + bytes(32 * 1024)),
+    "/static/analytics.js": ("application/javascript", b"window.__analytics = true;\n/*" + b" " * 16 * 1024 + b"*/\n"),
+}
+
+_EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+@dataclass
+class EndpointProfile:
+    """Comportamento simulado de um endpoint: latência base, variação (ms) e taxa de erro (0..1)."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    @classmethod
+    def parse(cls, spec):
+        """Converte "LATENCIA[:VARIACAO[:TAXA_ERRO]]" (ex.: "200:50:0.05") em um perfil."""
+        parts = [float(part) for part in spec.split(":")]
+        return cls(*parts)
+
+
+def parse_profiles(specs):
+    """Converte especificações "CAMINHO=LATENCIA[:VARIACAO[:TAXA_ERRO]]" em perfis por endpoint."""
+    profiles = {}
+    for spec in specs or []:
+        path, _, value = spec.partition("=")
+        profiles[path] = EndpointProfile.parse(value)
+    return profiles
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FakeUniversityPresence/1.0"
+
+    def log_message(self, format, *args):
+        pass  # Mantém a saída do pytest limpa
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if not self._apply_profile(path):
+            return
+        if path in ("/", "/login"):
+            self._send(200, LOGIN_PAGE, "text/html; charset=utf-8")
+        elif path in STATIC_ASSETS:
+            content_type, data = STATIC_ASSETS[path]
+            self._send(200, data, content_type)
+        elif path == "/dashboard":
+            email = self.server.app.session_email(self._session_token())
+            if email is None:
+                self._redirect("/")
+            else:
+                self._send(200, DASHBOARD_PAGE.replace("{email}", email), "text/html; charset=utf-8")
+        else:
+            self._send(404, "Not Found", "text/plain; charset=utf-8")
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        if not self._apply_profile(path):
+            return
+        if path != "/api/login":
+            self._send(404, "Not Found", "text/plain; charset=utf-8")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            payload = {}
+        status, body, token = self.server.app.login(payload.get("email") or "", payload.get("password") or "")
+        headers = {}
+        if token:
+            headers["Set-Cookie"] = f"session={token}; Path=/; HttpOnly; Max-Age={int(self.server.app.session_ttl)}"
+        self._send(status, json.dumps(body), "application/json", headers)
+
+    def _apply_profile(self, path):
+        """Aplica latência e falhas configuradas; retorna False se a requisição falhou."""
+        profile = self.server.app.profiles.get(path)
+        if profile is None:
+            return True
+        rng = self.server.app.random
+        delay = profile.latency_ms + rng.uniform(-profile.jitter_ms, profile.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if profile.error_rate and rng.random() < profile.error_rate:
+            self._send(503, json.dumps({"message": "Serviço indisponível"}), "application/json")
+            return False
+        return True
+
+    def _session_token(self):
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        return cookie["session"].value if "session" in cookie else None
+
+    def _redirect(self, location):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, status, body, content_type, headers=None):
+        data = body if isinstance(body, bytes) else body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakeLoginApp:
+    """
+    Aplicação de login simulada executada em uma thread em segundo plano.
+
+    Aceita apenas as `credentials` informadas; qualquer outra combinação (ou
+    email em formato inválido) recebe 422 com uma mensagem de erro.
+    """
+
+    def __init__(self, credentials, profiles=None, host="127.0.0.1", port=0, session_ttl=3600, seed=None):
+        self.credentials = credentials
+        self.profiles = profiles or {}
+        self.session_ttl = session_ttl
+        self.random = random.Random(seed)
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.app = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-login-app", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def login(self, email, password):
+        """Valida as credenciais e retorna (status, corpo, token de sessão)."""
+        if not email or not password:
+            return 422, {"message": "Email e senha são obrigatórios",
+                         "errors": {"email": not email, "password": not password}}, None
+        if not _EMAIL_PATTERN.match(email):
+            return 422, {"message": "Email inválido", "errors": {"email": True}}, None
+        if email != self.credentials["email"] or password != self.credentials["password"]:
+            return 422, {"message": "Email ou senha incorretos", "errors": {"credentials": True}}, None
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = (email, time.time() + self.session_ttl)
+        return 200, {"token": token, "email": email}, token
+
+    def session_email(self, token):
+        """Email do usuário da sessão, ou None se o token for desconhecido ou expirado."""
+        with self._lock:
+            session = self._sessions.get(token)
+        if session is None or session[1] < time.time():
+            return None
+        return session[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--email", default="test@universitypresence.com")
+    parser.add_argument("--password", default="123456")
+    parser.add_argument("--profile", action="append", help="CAMINHO=LATENCIA[:VARIACAO[:TAXA_ERRO]]")
+    args = parser.parse_args()
+
+    app = FakeLoginApp(
+        {"email": args.email, "password": args.password},
+        profiles=parse_profiles(args.profile),
+        host=args.host,
+        port=args.port,
+    ).start()
+    print(f"Aplicação de login simulada em {app.url} (Ctrl+C para encerrar)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        app.stop()
+
+
+if __name__ == "__main__":
+    main()
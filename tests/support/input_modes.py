@@ -0,0 +1,192 @@
+"""
+Estratégias de preenchimento de campos e medição do tempo gasto.
+
+- keystroke: clear() + send_keys(), um evento de teclado sintético por caractere
+  (fiel à digitação do usuário);
+- bulk: define o valor pelo setter nativo do elemento e dispara os eventos
+  `input` e `change` em um único execute_script. Usar o setter nativo (e não
+  `el.value = ...`) mantém a validação de inputs controlados de React/Vue.
+
+O tempo de cada preenchimento feito durante a execução de um teste é
+registrado por estratégia e o resumo (com a economia estimada do modo bulk)
+aparece ao final da execução do pytest. A estimativa usa o custo por
+caractere do modo keystroke e o custo por preenchimento do modo bulk; o modo
+que não rodou na execução usa o último custo medido, guardado no cache do
+pytest.
+"""
+import time
+from collections import defaultdict
+
+import pytest
+
+
+KEYSTROKE = "keystroke"
+BULK = "bulk"
+INPUT_MODES = (KEYSTROKE, BULK)
+
+COSTS_KEY = "qa-university-presence/custo-preenchimento"
+
+_BULK_FILL_SCRIPT = """
+var el = arguments[0], value = arguments[1];
+el.focus();
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
+class InputTimings:
+    """Acumula, por estratégia, preenchimentos, caracteres digitados e tempo gasto."""
+
+    def __init__(self):
+        self.totals = defaultdict(lambda: [0, 0, 0.0])
+
+    def record(self, mode, chars, elapsed_ms):
+        totals = self.totals[mode]
+        totals[0] += 1
+        totals[1] += chars
+        totals[2] += elapsed_ms
+
+    def merge(self, totals):
+        for mode, (fills, chars, elapsed_ms) in totals.items():
+            current = self.totals[mode]
+            current[0] += fills
+            current[1] += chars
+            current[2] += elapsed_ms
+
+    def drain(self):
+        totals, self.totals = dict(self.totals), defaultdict(lambda: [0, 0, 0.0])
+        return totals
+
+
+class FillRecorder:
+    """
+    Atribui cada preenchimento ao teste em execução, pelo nodeid.
+    Preenchimentos fora da fase de execução de um teste (ex.: o login feito
+    por uma fixture) não são atribuídos a nenhum teste.
+    """
+
+    def __init__(self):
+        self.active = None
+        self._by_test = {}
+
+    def record(self, mode, chars, elapsed_ms):
+        if self.active is not None:
+            self._by_test.setdefault(self.active, InputTimings()).record(mode, chars, elapsed_ms)
+
+    def drain(self, nodeid):
+        timings = self._by_test.pop(nodeid, None)
+        return timings.drain() if timings is not None else {}
+
+
+TIMINGS = FillRecorder()
+
+
+def fill(driver, element, value, mode=KEYSTROKE):
+    """Preenche o elemento com a estratégia informada e registra o tempo gasto."""
+    start = time.perf_counter()
+    if mode == BULK:
+        driver.execute_script(_BULK_FILL_SCRIPT, element, value)
+    elif mode == KEYSTROKE:
+        element.clear()
+        element.send_keys(value)
+    else:
+        raise ValueError(f"Modo de preenchimento desconhecido: {mode!r}. Use um de {INPUT_MODES}.")
+    TIMINGS.record(mode, len(value), (time.perf_counter() - start) * 1000)
+
+
+def marker_input_mode(marker):
+    """Modo de preenchimento de `@pytest.mark.input_mode(...)`; pytest.UsageError se inválido."""
+    mode = marker.args[0] if len(marker.args) == 1 and not marker.kwargs else marker.kwargs.get("mode")
+    if len(marker.args) + len(marker.kwargs) != 1 or mode not in INPUT_MODES:
+        raise pytest.UsageError(
+            f"@pytest.mark.input_mode espera um único modo entre {INPUT_MODES}; "
+            f"recebido args={marker.args!r}, kwargs={marker.kwargs!r}"
+        )
+    return mode
+
+
+class InputTimingPlugin:
+    """Coleta o tempo de preenchimento de cada teste (também com pytest-xdist) e resume ao final."""
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.session = InputTimings()
+
+    def pytest_collection_modifyitems(self, items):
+        for item in items:
+            marker = item.get_closest_marker("input_mode")
+            if marker is not None:
+                marker_input_mode(marker)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        TIMINGS.active = item.nodeid
+        try:
+            yield
+        finally:
+            TIMINGS.active = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if call.when == "call":
+            totals = TIMINGS.drain(item.nodeid)
+            if totals:
+                outcome.get_result().user_properties.append(("input_timings", totals))
+
+    def pytest_runtest_logreport(self, report):
+        for name, value in report.user_properties:
+            if name == "input_timings":
+                self.session.merge(value)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        totals = self.session.totals
+        if not totals:
+            return
+        terminalreporter.section("tempo de preenchimento dos campos")
+        for mode in INPUT_MODES:
+            if mode not in totals:
+                continue
+            fills, chars, elapsed_ms = totals[mode]
+            terminalreporter.write_line(
+                f"{mode:<10} {fills:>5} preenchimentos {chars:>7} caracteres {elapsed_ms:>10.1f} ms"
+            )
+        terminalreporter.write_line(self._saving_line(totals))
+
+    def pytest_sessionfinish(self, session):
+        """Guarda no cache os custos desta execução, usados quando um dos modos não rodar."""
+        # Só no processo principal: nos workers do xdist os totais são parciais
+        if self.cache is None or hasattr(session.config, "workerinput") or not self.session.totals:
+            return
+        costs = self._costs(self.session.totals)
+        self.cache.set(COSTS_KEY, {mode: cost for mode, (cost, _) in costs.items() if cost is not None})
+
+    def _costs(self, totals):
+        """
+        Custo por caractere do keystroke e por preenchimento do bulk: medidos nesta
+        execução ou, para o modo que não rodou, o último valor do cache.
+        """
+        stored = self.cache.get(COSTS_KEY, {}) if self.cache is not None else {}
+        _, keystroke_chars, keystroke_ms = totals.get(KEYSTROKE, (0, 0, 0.0))
+        bulk_fills, _, bulk_ms = totals.get(BULK, (0, 0, 0.0))
+        return {
+            KEYSTROKE: (keystroke_ms / keystroke_chars, "medido") if keystroke_chars else (stored.get(KEYSTROKE), "histórico"),
+            BULK: (bulk_ms / bulk_fills, "medido") if bulk_fills else (stored.get(BULK), "histórico"),
+        }
+
+    def _saving_line(self, totals):
+        costs = self._costs(totals)
+        missing = [mode for mode, (cost, _) in costs.items() if cost is None]
+        if missing:
+            return (f"economia estimada do modo bulk: sem estimativa (modo {', '.join(missing)} "
+                    f"não medido nesta execução nem em execuções anteriores)")
+        (per_char, per_char_source), (per_fill, per_fill_source) = costs[KEYSTROKE], costs[BULK]
+        # Custo de todos os preenchimentos da execução em cada modo: medido onde rodou, estimado no outro
+        keystroke_fills, keystroke_chars, keystroke_ms = totals.get(KEYSTROKE, (0, 0, 0.0))
+        bulk_fills, bulk_chars, bulk_ms = totals.get(BULK, (0, 0, 0.0))
+        saved_ms = (keystroke_ms + bulk_chars * per_char) - (bulk_ms + keystroke_fills * per_fill)
+        return (f"economia estimada do modo bulk: {saved_ms:.1f} ms "
+                f"({per_char:.2f} ms/caractere no modo keystroke, {per_char_source}; "
+                f"{per_fill:.2f} ms/preenchimento no modo bulk, {per_fill_source})")
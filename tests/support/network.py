@@ -0,0 +1,179 @@
+"""
+Espera orientada a eventos pelas requisições da página.
+Um contador injetado em fetch/XMLHttpRequest registra as requisições em
+andamento e as respostas recebidas, permitindo aguardar a resposta da API
+(e obter o status HTTP) sem pausas fixas.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Instala (uma vez por documento) o rastreador de requisições e um observador do DOM
+_TRACKER_SCRIPT = """
+(function () {
+    if (window.__qaNetwork) { return; }
+    var state = window.__qaNetwork = {
+        inflight: 0,
+        responses: [],
+        lastMutation: performance.now(),
+        listeners: []
+    };
+    function notify() {
+        state.listeners.slice().forEach(function (listener) { listener(); });
+    }
+    function finished(url, method, status) {
+        state.inflight = Math.max(0, state.inflight - 1);
+        state.responses.push({url: String(url), method: String(method || 'GET').toUpperCase(), status: status});
+        notify();
+    }
+
+    var originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (input, init) {
+            var url = (input && input.url) || input;
+            var method = (init && init.method) || (input && input.method) || 'GET';
+            state.inflight++;
+            return originalFetch.apply(this, arguments).then(function (response) {
+                finished(url, method, response.status);
+                return response;
+            }, function (error) {
+                finished(url, method, 0);
+                throw error;
+            });
+        };
+    }
+
+    var open = XMLHttpRequest.prototype.open;
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__qaRequest = {method: method, url: url};
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this;
+        var info = xhr.__qaRequest || {};
+        state.inflight++;
+        xhr.addEventListener('loadend', function () { finished(info.url, info.method, xhr.status); });
+        return send.apply(this, arguments);
+    };
+
+    new MutationObserver(function () {
+        state.lastMutation = performance.now();
+        notify();
+    }).observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+# Resolve assim que houver resposta para a URL esperada, nenhuma requisição
+# pendente e o DOM estiver sem mutações por `settle` ms
+_WAIT_SCRIPT = """
+var pattern = arguments[0], settle = arguments[1], timeout = arguments[2];
+var callback = arguments[arguments.length - 1];
+var state = window.__qaNetwork;
+if (!state) { callback(null); return; }
+var start = performance.now();
+var settleTimer = null, timeoutTimer = null, done = false;
+
+function lastMatch() {
+    for (var i = state.responses.length - 1; i >= 0; i--) {
+        if (state.responses[i].url.indexOf(pattern) !== -1) { return state.responses[i]; }
+    }
+    return null;
+}
+function finish(match, timedOut) {
+    if (done) { return; }
+    done = true;
+    clearTimeout(settleTimer);
+    clearTimeout(timeoutTimer);
+    state.listeners.splice(state.listeners.indexOf(check), 1);
+    callback(match && {url: match.url, method: match.method, status: match.status,
+                       elapsed: performance.now() - start, settled: !timedOut});
+}
+function check() {
+    var match = lastMatch();
+    if (!match || state.inflight > 0) { return; }
+    var quiet = performance.now() - state.lastMutation;
+    clearTimeout(settleTimer);
+    if (quiet >= settle) { finish(match, false); }
+    else { settleTimer = setTimeout(check, settle - quiet); }
+}
+state.listeners.push(check);
+timeoutTimer = setTimeout(function () { finish(lastMatch(), true); }, timeout);
+check();
+"""
+
+
+# Tempo limite de scripts assíncronos de toda sessão (padrão do WebDriver), restaurado pelo pool entre testes
+SCRIPT_TIMEOUT = 30
+
+
+@dataclass
+class ApiResponse:
+    """Resposta observada pelo rastreador de rede da página."""
+
+    url: str
+    method: str
+    status: int
+    elapsed_ms: float
+    settled: bool
+
+
+@contextmanager
+def script_timeout(driver, seconds):
+    """
+    Garante `seconds` de tempo limite aos scripts assíncronos do bloco.
+    Dentro do padrão da sessão (SCRIPT_TIMEOUT) não envia comando algum; acima
+    dele, aumenta o limite e volta ao padrão ao final do bloco.
+    """
+    if seconds <= SCRIPT_TIMEOUT:
+        yield
+        return
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+
+
+def assert_rejected(response, status, url_pattern, required=True):
+    """
+    Verifica que a resposta de login observada tem o status de rejeição `status`.
+    Sem resposta observada, falha se `required` (opção require_login_api_response).
+    """
+    if response is None:
+        assert not required, \
+            f"Nenhuma resposta da API de login ('{url_pattern}') foi observada após o envio do formulário"
+        return
+    assert response.status == status, \
+        f"API deve rejeitar o login com status {status}. Status recebido: {response.status} ({response.url})"
+
+
+def install_network_tracker(driver):
+    """Injeta o rastreador de requisições no documento atual."""
+    driver.execute_script(_TRACKER_SCRIPT)
+
+
+def wait_for_api_response(driver, url_pattern, timeout=5, settle_ms=100):
+    """
+    Aguarda a resposta de uma requisição cuja URL contenha `url_pattern`.
+
+    Retorna assim que a resposta chega, não há requisições pendentes e o DOM
+    permanece estável por `settle_ms`. Retorna None se nenhuma resposta for
+    observada no tempo limite ou se a página for descarregada (redirecionamento).
+    """
+    try:
+        with script_timeout(driver, timeout + 1):
+            result = driver.execute_async_script(_WAIT_SCRIPT, url_pattern, settle_ms, timeout * 1000)
+    except WebDriverException:
+        return None
+    if not result:
+        return None
+    return ApiResponse(
+        url=result["url"],
+        method=result["method"],
+        status=result["status"],
+        elapsed_ms=result["elapsed"],
+        settled=result["settled"],
+    )
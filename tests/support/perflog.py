@@ -0,0 +1,44 @@
+"""
+Leitura do log de desempenho do chromedriver (eventos do DevTools Protocol).
+O log só existe quando a sessão é criada com `goog:loggingPrefs` de
+performance e é esvaziado a cada leitura; por isso os eventos são acumulados
+aqui e compartilhados entre os consumidores (bloqueio de recursos, HAR, ...).
+"""
+import json
+
+
+class PerformanceLog:
+    """Eventos do DevTools Protocol de um driver, acumulados desde o início do teste."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.events = []
+
+    @classmethod
+    def attach(cls, driver):
+        """Retorna o log do driver, criando-o na primeira chamada."""
+        log = getattr(driver, "_qa_performance_log", None)
+        if log is None:
+            log = cls(driver)
+            driver._qa_performance_log = log
+        return log
+
+    def start(self):
+        """Descarta os eventos anteriores (ex.: do teste que usou a sessão antes)."""
+        self.collect()
+        self.events = []
+
+    def collect(self):
+        """Lê os eventos pendentes no chromedriver e retorna todos os acumulados."""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            self.events.append({
+                "method": message.get("method"),
+                "params": message.get("params", {}),
+                "timestamp": entry.get("timestamp"),
+            })
+        return self.events
+
+    def network_events(self, *methods):
+        """Eventos de rede já acumulados, filtrados pelos métodos informados."""
+        return [event for event in self.events if event["method"] in methods]
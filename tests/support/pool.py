@@ -0,0 +1,116 @@
+"""
+Pool de sessões do WebDriver reaproveitadas entre testes.
+Evita o custo de iniciar um processo do Chrome por teste, restaurando o
+estado do navegador entre usos e reciclando sessões degradadas.
+"""
+import threading
+
+from tests.support.network import SCRIPT_TIMEOUT
+
+# Limpa armazenamento da origem atual; falhas (ex.: about:blank) são ignoradas
+_CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class PooledSession:
+    """Sessão do navegador mantida pelo pool, com contagem de usos."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.broken = False
+
+
+class DriverPool:
+    """
+    Mantém sessões de WebDriver de longa duração compartilhadas entre testes.
+
+    Cada sessão é restaurada entre testes (cookies, localStorage,
+    sessionStorage, cache e navegação para about:blank) e reciclada quando
+    falha na verificação de saúde ou atinge `max_uses` testes.
+    """
+
+    def __init__(self, factory, max_uses=50):
+        self._factory = factory
+        self._max_uses = max_uses
+        self._idle = []
+        self._all = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Retorna uma sessão saudável, criando uma nova se necessário."""
+        while True:
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+            if session is None:
+                session = PooledSession(self._factory())
+                with self._lock:
+                    self._all.append(session)
+                break
+            if self._is_healthy(session.driver):
+                break
+            self._discard(session)
+        session.uses += 1
+        return session
+
+    def release(self, session):
+        """Devolve a sessão ao pool após restaurar o estado do navegador."""
+        if session.broken or session.uses >= self._max_uses:
+            self._discard(session)
+            return
+        try:
+            self.reset(session.driver)
+        except Exception:
+            self._discard(session)
+            return
+        with self._lock:
+            self._idle.append(session)
+
+    def close(self):
+        """Finaliza todas as sessões do pool."""
+        with self._lock:
+            sessions, self._all, self._idle = self._all, [], []
+        for session in sessions:
+            self._quit(session.driver)
+
+    @staticmethod
+    def reset(driver):
+        """
+        Restaura o navegador para um estado equivalente a uma sessão nova.
+        Fecha janelas extras, limpa armazenamento, cookies e cache, restaura o
+        tempo limite de scripts e volta para about:blank.
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+        driver.get("about:blank")
+
+    @staticmethod
+    def _is_healthy(driver):
+        """Verifica se a sessão ainda responde a comandos."""
+        try:
+            return driver.execute_script("return 1") == 1 and len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _discard(self, session):
+        with self._lock:
+            if session in self._all:
+                self._all.remove(session)
+        self._quit(session.driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
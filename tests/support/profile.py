@@ -0,0 +1,75 @@
+"""
+Perfil do Chrome para inicialização rápida.
+Reúne as flags que evitam trabalho de primeira execução (extensões,
+sincronização, verificações de navegador padrão, atualização de componentes) e
+mantém um perfil-modelo pré-aquecido, copiado para um diretório em tmpfs a
+cada sessão em vez de criar um perfil novo em disco.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+
+from tests.support.chromedriver_cache import CACHE_DIR, chrome_fingerprint
+
+
+FAST_STARTUP_ARGS = [
+    "--headless=new",
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-default-apps",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-domain-reliability",
+    "--disable-client-side-phishing-detection",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,InterestFeedContentSuggestions",
+]
+
+# Arquivos de trava e de estado da instância que não podem ser copiados do modelo
+_PROFILE_IGNORE = shutil.ignore_patterns("Singleton*", "lockfile", "*.lock", "Crashpad", "*.tmp")
+
+
+def profile_template_dir():
+    """Diretório do perfil-modelo da instalação atual do Chrome (um por versão instalada)."""
+    key = hashlib.sha1((chrome_fingerprint() or "chrome:not-found").encode("utf-8")).hexdigest()[:12]
+    return CACHE_DIR / f"profile-template-{key}"
+
+
+def ensure_profile_template(warm_up):
+    """
+    Retorna o perfil-modelo, criando-o na primeira chamada.
+    `warm_up(user_data_dir)` inicia e finaliza o Chrome no diretório informado,
+    deixando pronto o trabalho de primeira execução.
+    """
+    template = profile_template_dir()
+    if template.is_dir():
+        return template
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=CACHE_DIR, prefix=".profile-template-")
+    try:
+        warm_up(staging)
+        os.replace(staging, template)
+    except OSError:
+        # Outro worker criou o modelo ao mesmo tempo
+        if not template.is_dir():
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return template
+
+
+def tmpfs_root():
+    """Diretório em memória para os perfis das sessões (/dev/shm), quando disponível."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+def copy_profile(template, destination):
+    """Copia o perfil-modelo para o diretório da sessão."""
+    shutil.copytree(template, destination, ignore=_PROFILE_IGNORE, dirs_exist_ok=True)
@@ -0,0 +1,13 @@
+"""
+Integração dos plugins da suíte com o relatório do pytest-html.
+"""
+
+
+def add_html_extra(item, report, html):
+    """Anexa o trecho `html` ao relatório do teste; sem o pytest-html (ou sem --html ativo) não faz nada."""
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if pytest_html is None:
+        return
+    extras = getattr(report, "extras", [])
+    extras.append(pytest_html.extras.html(html))
+    report.extras = extras
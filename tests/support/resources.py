@@ -0,0 +1,246 @@
+"""
+Monitor de recursos dos processos do navegador.
+Para cada sessão observa a árvore chromedriver -> Chrome (RSS, tempo de CPU,
+descritores de arquivo abertos e número de processos filhos) antes e depois
+de cada teste, registra os números no relatório e marca a sessão do pool
+como quebrada quando algum limite é ultrapassado, para que ela seja
+reciclada; os processos que sobreviverem ao encerramento são finalizados.
+
+Ao final da execução, processos do Chrome que ainda usam um dos perfis
+temporários desta execução (`qa-chrome-*`) são considerados órfãos e
+finalizados.
+
+Requer o pacote `psutil`.
+"""
+from dataclasses import asdict, dataclass, field
+
+import pytest
+
+try:
+    import psutil
+except ImportError:  # Necessário apenas com --resource-monitor
+    psutil = None
+
+from tests.support.reporting import add_html_extra
+
+POOLED_SESSION_KEY = pytest.StashKey[object]()
+
+_AFTER_KEY = pytest.StashKey[object]()
+_RESOURCES_KEY = pytest.StashKey[dict]()
+
+_MB = 1024 * 1024
+
+# Tempo (s) concedido para os processos terminarem antes de serem mortos
+_TERMINATE_GRACE = 3
+
+
+def require_psutil():
+    if psutil is None:
+        raise pytest.UsageError("--resource-monitor requer o pacote psutil: pip install psutil")
+
+
+@dataclass
+class ResourceSample:
+    """Consumo somado da árvore de processos de uma sessão."""
+
+    rss_bytes: int = 0
+    cpu_seconds: float = 0.0
+    open_fds: int = 0
+    children: int = 0
+    processes: list = field(default_factory=list, repr=False)  # (pid, create_time)
+
+    def summary(self):
+        data = asdict(self)
+        del data["processes"]
+        data["rss_mb"] = round(self.rss_bytes / _MB, 1)
+        data["cpu_seconds"] = round(self.cpu_seconds, 3)
+        return data
+
+
+@dataclass
+class ResourceLimits:
+    """Limites por sessão; zero desativa o limite."""
+
+    max_rss_mb: float = 0
+    max_rss_growth_mb: float = 0
+    max_fds: int = 0
+    max_children: int = 0
+
+    def violations(self, before, after):
+        reasons = []
+        if self.max_rss_mb and after.rss_bytes > self.max_rss_mb * _MB:
+            reasons.append(f"RSS {after.rss_bytes / _MB:.0f} MB > {self.max_rss_mb:.0f} MB")
+        growth = after.rss_bytes - before.rss_bytes
+        if self.max_rss_growth_mb and growth > self.max_rss_growth_mb * _MB:
+            reasons.append(f"RSS cresceu {growth / _MB:.0f} MB no teste > {self.max_rss_growth_mb:.0f} MB")
+        if self.max_fds and after.open_fds > self.max_fds:
+            reasons.append(f"{after.open_fds} descritores abertos > {self.max_fds}")
+        if self.max_children and after.children > self.max_children:
+            reasons.append(f"{after.children} processos filhos > {self.max_children}")
+        return reasons
+
+
+def _open_fds(process):
+    return process.num_fds() if hasattr(process, "num_fds") else process.num_handles()
+
+
+def sample_driver(driver):
+    """Mede a árvore de processos iniciada pelo chromedriver da sessão (None se indisponível)."""
+    service_process = getattr(getattr(driver, "service", None), "process", None)
+    if service_process is None:
+        return None
+    try:
+        root = psutil.Process(service_process.pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    sample = ResourceSample(children=len(processes) - 1)
+    for process in processes:
+        try:
+            with process.oneshot():
+                cpu = process.cpu_times()
+                sample.rss_bytes += process.memory_info().rss
+                sample.cpu_seconds += cpu.user + cpu.system
+                sample.open_fds += _open_fds(process)
+                sample.processes.append((process.pid, process.create_time()))
+        except psutil.Error:
+            continue  # Processo terminou durante a leitura
+    return sample
+
+
+def _alive(processes):
+    """Processos ainda vivos entre os (pid, create_time) informados, ignorando pids reutilizados."""
+    alive = []
+    for pid, created in processes:
+        try:
+            process = psutil.Process(pid)
+            if process.create_time() == created and process.status() != psutil.STATUS_ZOMBIE:
+                alive.append(process)
+        except psutil.Error:
+            continue
+    return alive
+
+
+def terminate(processes):
+    """Encerra os processos (terminate e, após o prazo, kill); retorna quantos foram finalizados."""
+    for process in processes:
+        try:
+            process.terminate()
+        except psutil.Error:
+            pass
+    _, remaining = psutil.wait_procs(processes, timeout=_TERMINATE_GRACE)
+    for process in remaining:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    return len(processes)
+
+
+def find_orphans(profile_dirs):
+    """Processos iniciados com `--user-data-dir` apontando para um dos diretórios de perfil informados."""
+    if not profile_dirs:
+        return []
+    arguments = {f"--user-data-dir={profile_dir}" for profile_dir in profile_dirs}
+    orphans = []
+    for process in psutil.process_iter(["cmdline"]):
+        if arguments.intersection(process.info["cmdline"] or []):
+            orphans.append(process)
+    return orphans
+
+
+class ResourceMonitorPlugin:
+    """Amostra os recursos do navegador em cada teste e recicla sessões acima dos limites."""
+
+    def __init__(self, limits):
+        self.limits = limits
+        self.profile_dirs = set()
+        self.peak_rss = 0
+        self.recycled = 0
+        self.killed = 0
+        self.reaped = 0
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        driver = item.funcargs.get("driver")
+        before = sample_driver(driver) if driver is not None else None
+        yield
+        if before is None:
+            return
+        after = sample_driver(driver)
+        if after is None:
+            return
+        profile_dir = getattr(driver, "profile_dir", None)
+        if profile_dir:
+            self.profile_dirs.add(profile_dir)
+        reasons = self.limits.violations(before, after)
+        if reasons:
+            session = item.stash.get(POOLED_SESSION_KEY, None)
+            if session is not None:
+                session.broken = True  # O pool descarta a sessão em vez de devolvê-la
+        item.stash[_AFTER_KEY] = after
+        item.stash[_RESOURCES_KEY] = {"before": before.summary(), "after": after.summary(), "recycled": reasons}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield
+        # A fixture `driver` já devolveu a sessão; se ela foi reciclada, nada dela deve sobreviver
+        resources = item.stash.get(_RESOURCES_KEY, None)
+        if resources and resources["recycled"]:
+            survivors = _alive(item.stash[_AFTER_KEY].processes)
+            if survivors:
+                self.killed += terminate(survivors)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        resources = item.stash.get(_RESOURCES_KEY, None)
+        if call.when != "call" or resources is None:
+            return
+        report = outcome.get_result()
+        report.user_properties.append(("browser_resources", resources))
+        before, after = resources["before"], resources["after"]
+        recycled = "; ".join(resources["recycled"]) or "não"
+        add_html_extra(
+            item,
+            report,
+            f"<p><b>Recursos do navegador:</b> RSS {before['rss_mb']} → {after['rss_mb']} MB, "
+            f"CPU {after['cpu_seconds'] - before['cpu_seconds']:.2f}s, "
+            f"descritores {before['open_fds']} → {after['open_fds']}, "
+            f"processos filhos {before['children']} → {after['children']}; sessão reciclada: {recycled}</p>",
+        )
+
+    def pytest_runtest_logreport(self, report):
+        # Também no processo principal do xdist, a partir das propriedades enviadas pelos workers
+        for name, value in report.user_properties:
+            if name == "browser_resources":
+                self.peak_rss = max(self.peak_rss, value["after"]["rss_bytes"])
+                self.recycled += bool(value["recycled"])
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        # Depois do pytest_sessionfinish do runner, que finaliza as fixtures de sessão ainda ativas
+        # (execução interrompida por -x/--maxfail/--fail-fast): o pool já encerrou suas sessões e
+        # o que ainda usa nossos perfis é órfão
+        orphans = find_orphans(self.profile_dirs)
+        if orphans:
+            self.reaped += terminate(orphans)
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["qa_browser_processes"] = {"killed": self.killed, "reaped": self.reaped}
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        # Processos finalizados pelos workers do xdist
+        counts = getattr(node, "workeroutput", {}).get("qa_browser_processes", {})
+        self.killed += counts.get("killed", 0)
+        self.reaped += counts.get("reaped", 0)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not (self.peak_rss or self.killed or self.reaped):
+            return
+        terminalreporter.section("recursos do navegador")
+        terminalreporter.write_line(f"pico de RSS por sessão: {self.peak_rss / _MB:.0f} MB")
+        terminalreporter.write_line(
+            f"sessões recicladas: {self.recycled}, processos finalizados: {self.killed}, órfãos finalizados: {self.reaped}"
+        )
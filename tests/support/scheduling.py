@@ -0,0 +1,147 @@
+"""
+Histórico de duração e resultado dos testes e ordenação da execução a partir dele.
+O histórico fica no cache do pytest (.pytest_cache), é atualizado a cada
+execução pelo processo principal e, com --schedule-by-history (ou
+--fail-fast N), define a ordem dos testes:
+
+1. testes que falharam recentemente primeiro (menor tempo até a primeira falha);
+2. os demais do mais longo para o mais curto (longest processing time first).
+
+Com pytest-xdist em `--dist loadgroup`, os testes são distribuídos em um
+grupo (`xdist_group`) por worker, preenchendo sempre o grupo com menor carga
+estimada, para equilibrar o tempo total de cada worker.
+"""
+import re
+import statistics
+import time
+
+import pytest
+
+
+HISTORY_KEY = "qa-university-presence/historico-testes"
+
+# Execuções lembradas por teste e resumos de execução mantidos no histórico
+HISTORY_DEPTH = 10
+RUNS_DEPTH = 20
+
+SHARD_PREFIX = "qa-shard-"
+_SHARD_SUFFIX = re.compile(r"@" + SHARD_PREFIX + r"\d+$")
+
+
+def _nodeid(report):
+    """Identificador do teste sem o sufixo de grupo adicionado pelo xdist em loadgroup."""
+    return _SHARD_SUFFIX.sub("", report.nodeid)
+
+
+def failure_score(outcomes):
+    """Peso das falhas recentes: a última execução vale 1, a anterior 0.5, e assim por diante."""
+    return sum(0.5 ** age for age, outcome in enumerate(reversed(outcomes)) if outcome == "failed")
+
+
+def estimated_duration(entry, default):
+    durations = (entry or {}).get("durations")
+    return statistics.median(durations) if durations else default
+
+
+def order_items(items, history):
+    """Falhas recentes primeiro (as mais curtas antes); depois do teste mais longo para o mais curto."""
+    tests = history.get("tests", {})
+    known = [statistics.median(entry["durations"]) for entry in tests.values() if entry.get("durations")]
+    default = statistics.median(known) if known else 0.0
+
+    def key(item):
+        entry = tests.get(item.nodeid)
+        score = failure_score((entry or {}).get("outcomes", []))
+        duration = estimated_duration(entry, default)
+        return (-score, duration) if score else (0, -duration)
+
+    estimates = {item.nodeid: estimated_duration(tests.get(item.nodeid), default) for item in items}
+    return sorted(items, key=key), estimates
+
+
+def pack_shards(items, estimates, workers):
+    """Atribui cada teste (na ordem recebida) ao grupo com menor carga estimada."""
+    loads = [0.0] * workers
+    shards = {}
+    for item in items:
+        shard = loads.index(min(loads))
+        loads[shard] += estimates[item.nodeid]
+        shards[item.nodeid] = shard
+    return shards, loads
+
+
+class SchedulingPlugin:
+    """Registra o histórico dos testes e, se habilitado, ordena e distribui a execução."""
+
+    def __init__(self, config, reorder):
+        self.config = config
+        self.reorder = reorder
+        self.history = config.cache.get(HISTORY_KEY, {"tests": {}, "runs": []})
+        self.durations = {}
+        self.outcomes = {}
+        self.worker_busy = {}
+        self.started = None
+        self.first_failure = None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        # Executado antes do xdist, que acrescenta o grupo ao nodeid em loadgroup
+        if not self.reorder or not items:
+            return
+        ordered, estimates = order_items(items, self.history)
+        items[:] = ordered
+        workerinput = getattr(config, "workerinput", None)
+        if workerinput is not None and config.getvalue("loadgroup"):
+            shards, _ = pack_shards(items, estimates, workerinput["workercount"])
+            for item in items:
+                item.add_marker(pytest.mark.xdist_group(f"{SHARD_PREFIX}{shards[item.nodeid]}"))
+
+    def pytest_sessionstart(self, session):
+        self.started = time.monotonic()
+
+    def pytest_runtest_logreport(self, report):
+        nodeid = _nodeid(report)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+        if report.failed:
+            self.outcomes[nodeid] = "failed"
+            if self.first_failure is None:
+                self.first_failure = time.monotonic() - self.started
+        elif report.when == "call" or (report.skipped and nodeid not in self.outcomes):
+            self.outcomes.setdefault(nodeid, report.outcome)
+        worker = getattr(getattr(report, "node", None), "gateway", None)
+        if worker is not None:
+            self.worker_busy[worker.id] = self.worker_busy.get(worker.id, 0.0) + report.duration
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, "workerinput") or not self.outcomes:
+            return
+        terminalreporter.section("agendamento")
+        if self.first_failure is not None:
+            terminalreporter.write_line(f"tempo até a primeira falha: {self.first_failure:.1f}s")
+        if self.worker_busy:
+            busy = ", ".join(f"{worker}={seconds:.1f}s" for worker, seconds in sorted(self.worker_busy.items()))
+            spread = max(self.worker_busy.values()) - min(self.worker_busy.values())
+            terminalreporter.write_line(f"tempo por worker: {busy} (diferença {spread:.1f}s)")
+
+    def pytest_sessionfinish(self, session):
+        # Com pytest-xdist apenas o processo principal recebe todos os resultados
+        if hasattr(session.config, "workerinput") or not self.outcomes:
+            return
+        tests = self.history.setdefault("tests", {})
+        for nodeid, outcome in self.outcomes.items():
+            if outcome == "skipped":
+                continue
+            entry = tests.setdefault(nodeid, {"durations": [], "outcomes": []})
+            entry["durations"] = (entry["durations"] + [round(self.durations[nodeid], 3)])[-HISTORY_DEPTH:]
+            entry["outcomes"] = (entry["outcomes"] + [outcome])[-HISTORY_DEPTH:]
+        runs = self.history.setdefault("runs", [])
+        runs.append({
+            "finished": time.time(),
+            "reordered": self.reorder,
+            "tests": len(self.outcomes),
+            "failures": sum(outcome == "failed" for outcome in self.outcomes.values()),
+            "time_to_first_failure_s": round(self.first_failure, 3) if self.first_failure is not None else None,
+            "worker_busy_s": {worker: round(seconds, 3) for worker, seconds in self.worker_busy.items()},
+        })
+        self.history["runs"] = runs[-RUNS_DEPTH:]
+        session.config.cache.set(HISTORY_KEY, self.history)
@@ -0,0 +1,163 @@
+"""
+Métricas de desempenho da página (Navigation Timing, Resource Timing,
+FCP/LCP e long tasks) coletadas pelas APIs do navegador, com verificação de
+orçamentos configurados no pytest.ini (`perf_budgets`).
+
+Cada orçamento tem o formato "PAGINA.METRICA <= VALOR", por exemplo
+"login.lcp_ms <= 2500". Um orçamento estourado falha o teste; as métricas de
+todos os testes vão para um JSON por execução e para o relatório pytest-html.
+"""
+import json
+import re
+from dataclasses import dataclass
+
+import pytest
+
+from tests.support.network import script_timeout
+from tests.support.reporting import add_html_extra
+
+
+# Lê as métricas depois do evento load, dando tempo aos observers de entregar LCP e long tasks
+_COLLECT_SCRIPT = """
+var callback = arguments[arguments.length - 1];
+var lcp = null, longTasks = [];
+function observe(type, handler) {
+    try { new PerformanceObserver(function (list) { list.getEntries().forEach(handler); })
+            .observe({type: type, buffered: true}); } catch (e) {}
+}
+observe('largest-contentful-paint', function (entry) { lcp = entry.startTime; });
+observe('longtask', function (entry) { longTasks.push(entry.duration); });
+
+function collect() {
+    setTimeout(function () {
+        var nav = performance.getEntriesByType('navigation')[0] || {};
+        var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+        var resources = performance.getEntriesByType('resource');
+        var slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; }).slice(0, 5);
+        callback({
+            url: location.href,
+            ttfb_ms: nav.responseStart || null,
+            dom_content_loaded_ms: nav.domContentLoadedEventEnd || null,
+            load_ms: nav.loadEventEnd || null,
+            transfer_bytes: (nav.transferSize || 0) + resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); }, 0),
+            resource_count: resources.length,
+            fcp_ms: fcp ? fcp.startTime : null,
+            lcp_ms: lcp,
+            long_tasks: longTasks.length,
+            long_tasks_ms: longTasks.reduce(function (sum, d) { return sum + d; }, 0),
+            slowest_resources: slowest.map(function (r) {
+                return {name: r.name, type: r.initiatorType, duration_ms: r.duration, transfer_bytes: r.transferSize};
+            })
+        });
+    }, 50);
+}
+if (document.readyState === 'complete') { collect(); }
+else { window.addEventListener('load', collect); }
+"""
+
+# Métricas produzidas por _COLLECT_SCRIPT que aceitam orçamento
+METRICS = (
+    "ttfb_ms", "fcp_ms", "lcp_ms", "dom_content_loaded_ms", "load_ms",
+    "long_tasks", "long_tasks_ms", "transfer_bytes", "resource_count",
+)
+
+_BUDGET_PATTERN = re.compile(r"^\s*(\w+)\.(\w+)\s*<=\s*([\d.]+)\s*$")
+
+_TIMINGS_KEY = pytest.StashKey[list]()
+
+
+@dataclass
+class Budget:
+    """Limite máximo de uma métrica em uma página."""
+
+    page: str
+    metric: str
+    limit: float
+
+    @classmethod
+    def parse(cls, spec):
+        match = _BUDGET_PATTERN.match(spec)
+        if match is None:
+            raise pytest.UsageError(f"Orçamento inválido em perf_budgets: {spec!r}. Use 'PAGINA.METRICA <= VALOR'.")
+        page, metric, limit = match.groups()
+        if metric not in METRICS:
+            raise pytest.UsageError(
+                f"Métrica desconhecida em perf_budgets: {spec!r}. Métricas disponíveis: {', '.join(METRICS)}."
+            )
+        return cls(page, metric, float(limit))
+
+
+def collect_page_timing(driver, timeout=10):
+    """Coleta as métricas de desempenho da página atual."""
+    with script_timeout(driver, timeout):
+        return driver.execute_async_script(_COLLECT_SCRIPT)
+
+
+class PageTimingCollector:
+    """Coletor do teste atual; inativo (sem custo) quando a coleta não foi habilitada."""
+
+    def __init__(self, node, budgets, enabled):
+        self.node = node
+        self.budgets = budgets
+        self.enabled = enabled
+
+    def collect(self, driver, page):
+        """Coleta as métricas da página e falha o teste se algum orçamento for estourado."""
+        if not self.enabled:
+            return None
+        metrics = collect_page_timing(driver)
+        violations = []
+        for budget in self.budgets:
+            value = metrics.get(budget.metric)
+            if budget.page == page and value is not None and value > budget.limit:
+                violations.append(f"{page}.{budget.metric} = {value:.0f} > {budget.limit:.0f}")
+        self.node.stash.setdefault(_TIMINGS_KEY, []).append({"page": page, "metrics": metrics, "violations": violations})
+        if violations:
+            pytest.fail("Orçamento de desempenho estourado: " + "; ".join(violations), pytrace=False)
+        return metrics
+
+
+def _timings_html(timings):
+    rows = []
+    for timing in timings:
+        metrics = timing["metrics"]
+        cells = "".join(
+            f"<td>{metrics.get(name):.0f}</td>" if isinstance(metrics.get(name), (int, float)) else "<td>-</td>"
+            for name in ("ttfb_ms", "fcp_ms", "lcp_ms", "dom_content_loaded_ms", "load_ms", "long_tasks_ms")
+        )
+        status = "; ".join(timing["violations"]) or "ok"
+        rows.append(f"<tr><td>{timing['page']}</td>{cells}<td>{metrics.get('resource_count')}</td><td>{status}</td></tr>")
+    return (
+        "<table><tr><th>página</th><th>TTFB</th><th>FCP</th><th>LCP</th><th>DCL</th><th>load</th>"
+        "<th>long tasks</th><th>recursos</th><th>orçamento</th></tr>" + "".join(rows) + "</table>"
+    )
+
+
+class PageTimingPlugin:
+    """Anexa as métricas de cada teste ao relatório e grava o JSON da execução."""
+
+    def __init__(self, output):
+        self.output = output
+        self.results = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        timings = item.stash.get(_TIMINGS_KEY, None)
+        if call.when != "call" or not timings:
+            return
+        report = outcome.get_result()
+        report.user_properties.append(("page_timing", timings))
+        add_html_extra(item, report, _timings_html(timings))
+
+    def pytest_runtest_logreport(self, report):
+        for name, value in report.user_properties:
+            if name == "page_timing":
+                self.results.append({"test": report.nodeid, "pages": value})
+
+    def pytest_sessionfinish(self, session):
+        # Com pytest-xdist apenas o processo principal grava o arquivo consolidado
+        if hasattr(session.config, "workerinput") or not self.results:
+            return
+        with open(self.output, "w", encoding="utf-8") as f:
+            json.dump(self.results, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,208 @@
+"""
+Rastreamento dos comandos do WebDriver por teste.
+Cada comando enviado ao chromedriver (find_element, send_keys, execute_script,
+get_attribute, ...), cada comando da fachada CDP (`--driver-backend cdp`,
+registrado pelo método do protocolo) e cada espera explícita (WebDriverWait)
+é registrado com tempos e atribuído ao helper que o originou (_fill_email,
+_submit_form, _find_error_message, ...). O resumo por teste (idas e voltas, tempo em
+comandos e em esperas) é gravado em JSON e anexado ao relatório pytest-html.
+"""
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.support.cdp import AWAIT_PROMISE_COMMAND, CdpDriver
+from tests.support.reporting import add_html_extra
+
+
+_WAIT_FILE = os.path.normcase(os.path.join("selenium", "webdriver", "support", "wait.py"))
+
+# Comandos que bloqueiam aguardando a página (contabilizados também como espera)
+_WAITING_COMMANDS = {"executeAsyncScript", "w3cExecuteScriptAsync", AWAIT_PROMISE_COMMAND}
+
+_SUMMARY_KEY = pytest.StashKey[dict]()
+
+
+def _caller_helper():
+    """
+    Identifica o helper da suíte responsável pelo comando atual.
+    Usa o helper (função iniciada por "_") mais interno definido em um módulo
+    de teste; sem helper, usa o próprio teste. Indica também se o comando
+    ocorre dentro de uma espera explícita.
+    """
+    helper = None
+    test_name = None
+    in_wait = False
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        if os.path.normcase(code.co_filename).endswith(_WAIT_FILE):
+            in_wait = True
+        elif filename.startswith("test_"):
+            if helper is None and code.co_name.startswith("_") and not code.co_name.startswith("__"):
+                helper = code.co_name
+            if code.co_name.startswith("test_"):
+                test_name = code.co_name
+                break
+        frame = frame.f_back
+    return helper or test_name or "<fixture>", in_wait
+
+
+class CommandTracer:
+    """Registra os comandos de um driver enquanto um teste está ativo."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.events = None
+        self._origin = None
+        executor = driver.command_executor
+        original = executor.execute
+
+        def execute(command, params):
+            return self._traced(command, lambda: original(command, params))
+
+        executor.execute = execute
+        if isinstance(driver, CdpDriver):
+            driver.command_hook = self._traced
+
+    @classmethod
+    def attach(cls, driver):
+        """Retorna o rastreador do driver, instalando-o na primeira chamada."""
+        tracer = getattr(driver, "_qa_tracer", None)
+        if tracer is None:
+            tracer = cls(driver)
+            driver._qa_tracer = tracer
+        return tracer
+
+    def start(self):
+        self.events = []
+        self._origin = time.perf_counter()
+
+    def stop(self):
+        """Finaliza o rastreamento e retorna os eventos registrados."""
+        events, self.events = self.events or [], None
+        return events
+
+    def _traced(self, name, run):
+        if self.events is None:
+            return run()
+        helper, in_wait = _caller_helper()
+        start = time.perf_counter()
+        try:
+            return run()
+        finally:
+            self._record("command", name, helper, in_wait, start)
+
+    def _record(self, kind, name, helper, in_wait, start):
+        if self.events is None:
+            return
+        end = time.perf_counter()
+        self.events.append({
+            "kind": kind,
+            "name": name,
+            "helper": helper,
+            "in_wait": in_wait,
+            "start_ms": round((start - self._origin) * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3),
+        })
+
+
+def _traced_until(original):
+    def until(self, method, message=""):
+        tracer = getattr(self._driver, "_qa_tracer", None)
+        if tracer is None or tracer.events is None:
+            return original(self, method, message)
+        helper, _ = _caller_helper()
+        start = time.perf_counter()
+        try:
+            return original(self, method, message)
+        finally:
+            tracer._record("wait", "WebDriverWait.until", helper, False, start)
+    return until
+
+
+def summarize(test_id, events):
+    """Resumo do teste: idas e voltas, tempo em comandos e esperas e agregados por helper e comando."""
+    commands = [e for e in events if e["kind"] == "command"]
+    waits = [e for e in events if e["kind"] == "wait"]
+    by_helper = defaultdict(lambda: {"commands": 0, "command_ms": 0.0})
+    by_command = defaultdict(lambda: {"count": 0, "total_ms": 0.0})
+    for event in commands:
+        by_helper[event["helper"]]["commands"] += 1
+        by_helper[event["helper"]]["command_ms"] += event["duration_ms"]
+        by_command[event["name"]]["count"] += 1
+        by_command[event["name"]]["total_ms"] += event["duration_ms"]
+    wait_ms = sum(e["duration_ms"] for e in waits)
+    wait_ms += sum(e["duration_ms"] for e in commands if e["name"] in _WAITING_COMMANDS and not e["in_wait"])
+    return {
+        "test": test_id,
+        "round_trips": len(commands),
+        "command_time_ms": round(sum(e["duration_ms"] for e in commands), 3),
+        "wait_time_ms": round(wait_ms, 3),
+        "by_helper": {k: {"commands": v["commands"], "command_ms": round(v["command_ms"], 3)} for k, v in by_helper.items()},
+        "by_command": {k: {"count": v["count"], "total_ms": round(v["total_ms"], 3)} for k, v in by_command.items()},
+        "events": events,
+    }
+
+
+def _summary_html(summary):
+    rows = "".join(
+        f"<tr><td>{helper}</td><td>{data['commands']}</td><td>{data['command_ms']:.1f}</td></tr>"
+        for helper, data in sorted(summary["by_helper"].items(), key=lambda item: -item[1]["command_ms"])
+    )
+    return (
+        f"<div><p><b>WebDriver:</b> {summary['round_trips']} idas e voltas, "
+        f"{summary['command_time_ms']:.1f} ms em comandos, {summary['wait_time_ms']:.1f} ms em esperas</p>"
+        f"<table><tr><th>helper</th><th>comandos</th><th>tempo (ms)</th></tr>{rows}</table></div>"
+    )
+
+
+class TracingPlugin:
+    """Plugin do pytest que rastreia os comandos do driver de cada teste."""
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self._original_until = WebDriverWait.until
+
+    def pytest_configure(self, config):
+        WebDriverWait.until = _traced_until(self._original_until)
+
+    def pytest_unconfigure(self, config):
+        WebDriverWait.until = self._original_until
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        driver = item.funcargs.get("driver")
+        tracer = CommandTracer.attach(driver) if driver is not None else None
+        if tracer is not None:
+            tracer.start()
+        yield
+        if tracer is not None:
+            item.stash[_SUMMARY_KEY] = summarize(item.nodeid, tracer.stop())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        summary = item.stash.get(_SUMMARY_KEY, None)
+        if call.when != "call" or summary is None:
+            return
+        report = outcome.get_result()
+        path = self._write(summary)
+        report.user_properties.append(("webdriver_round_trips", summary["round_trips"]))
+        report.user_properties.append(("webdriver_trace", path))
+        add_html_extra(item, report, _summary_html(summary))
+
+    def _write(self, summary):
+        os.makedirs(self.output_dir, exist_ok=True)
+        filename = re.sub(r"[^\w.-]+", "_", summary["test"]).strip("_") + ".json"
+        path = os.path.join(self.output_dir, filename)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        return path
@@ -0,0 +1,109 @@
+"""
+Esperas por push: um único execute_async_script avalia as condições na
+página e, enquanto nenhuma vale, reavalia a cada mutação do DOM
+(MutationObserver) e a cada evento input/change/invalid/submit. A espera
+termina no momento em que alguma condição passa a valer, sem o intervalo de
+0,5 s do WebDriverWait nem os vários comandos do WebDriver por consulta.
+
+O resultado informa qual condição venceu, o que a disparou (verificação
+inicial, mutação ou evento) e o tempo decorrido dentro da página.
+"""
+from dataclasses import asdict, dataclass
+
+from selenium.common.exceptions import TimeoutException
+
+from tests.support.network import script_timeout
+
+
+_WAIT_SCRIPT = """
+var conditions = arguments[0], timeoutMs = arguments[1], callback = arguments[arguments.length - 1];
+var start = performance.now(), done = false, observer = null, timer = null;
+var events = ['input', 'change', 'invalid', 'submit'];
+
+function holds(condition) {
+    var el = document.querySelector(condition.selector);
+    switch (condition.kind) {
+        case 'present': return el !== null;
+        case 'validation_message': return !!(el && el.validationMessage);
+        case 'required': return !!(el && el.hasAttribute('required'));
+        case 'aria_invalid': return !!(el && el.getAttribute('aria-invalid') === 'true');
+    }
+    return false;
+}
+function finish(name, trigger) {
+    done = true;
+    if (observer) { observer.disconnect(); }
+    events.forEach(function (type) { document.removeEventListener(type, onEvent, true); });
+    clearTimeout(timer);
+    callback({condition: name, trigger: trigger, elapsed: performance.now() - start});
+}
+function check(trigger) {
+    if (done) { return; }
+    for (var i = 0; i < conditions.length; i++) {
+        if (holds(conditions[i])) { finish(conditions[i].name, trigger); return; }
+    }
+}
+function onEvent(event) { check(event.type); }
+
+check('inicial');
+if (!done) {
+    observer = new MutationObserver(function () { check('mutacao'); });
+    observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+    // Fase de captura: 'invalid' não propaga até o document
+    events.forEach(function (type) { document.addEventListener(type, onEvent, true); });
+    timer = setTimeout(function () { finish(null, 'tempo_limite'); }, timeoutMs);
+}
+"""
+
+
+@dataclass
+class Condition:
+    """Condição avaliada na página: `kind` aplicado ao primeiro elemento de `selector`."""
+
+    name: str
+    kind: str
+    selector: str
+
+
+@dataclass
+class WaitResult:
+    """Condição que encerrou a espera, o que a disparou e o tempo decorrido na página."""
+
+    condition: str
+    trigger: str
+    elapsed_ms: float
+
+
+def element_present(selector, name=None):
+    """Algum elemento casa com o seletor CSS."""
+    return Condition(name or f"presente {selector}", "present", selector)
+
+
+def validation_message(selector, name=None):
+    """O campo tem `validationMessage` não vazia (validação HTML5)."""
+    return Condition(name or f"validationMessage {selector}", "validation_message", selector)
+
+
+def field_required(selector, name=None):
+    """O campo tem o atributo `required`."""
+    return Condition(name or f"required {selector}", "required", selector)
+
+
+def aria_invalid(selector, name=None):
+    """O campo está marcado com aria-invalid="true"."""
+    return Condition(name or f"aria-invalid {selector}", "aria_invalid", selector)
+
+
+def wait_for_any(driver, *conditions, timeout=5):
+    """
+    Aguarda até que alguma das condições valha e retorna o WaitResult.
+    Lança TimeoutException (como o WebDriverWait) se nenhuma valer no tempo limite.
+    O próprio script encerra a espera em `timeout`; dentro do tempo limite de
+    scripts da sessão, a espera é um único comando do WebDriver.
+    """
+    with script_timeout(driver, timeout + 1):
+        result = driver.execute_async_script(_WAIT_SCRIPT, [asdict(condition) for condition in conditions], timeout * 1000)
+    if not result or result["condition"] is None:
+        names = ", ".join(condition.name for condition in conditions)
+        raise TimeoutException(f"Nenhuma condição satisfeita em {timeout}s: {names}")
+    return WaitResult(condition=result["condition"], trigger=result["trigger"], elapsed_ms=result["elapsed"])
@@ -0,0 +1,51 @@
+"""
+Testes da área autenticada (painel).
+Chegam ao painel pelo estado autenticado reaproveitado (`authenticated_driver`),
+sem repetir o login pela interface em cada teste.
+"""
+import copy
+from dataclasses import replace
+
+import pytest
+from selenium.webdriver.common.by import By
+
+
+@pytest.mark.ui
+class TestDashboard:
+    """Classe de testes da página pós-login."""
+
+    DASHBOARD_LOCATOR = (By.CSS_SELECTOR, "[data-testid='success'], .dashboard")
+
+    def test_dashboard_acesso_com_sessao_restaurada(self, authenticated_driver, valid_credentials):
+        """
+        Teste: Acesso ao painel com o estado autenticado restaurado.
+        Cenário: Cookies e armazenamento do login do worker injetados na sessão.
+        Resultado esperado: Painel exibido para o usuário, com o token no localStorage.
+        """
+        dashboard = authenticated_driver.find_element(*self.DASHBOARD_LOCATOR)
+        assert valid_credentials["email"] in dashboard.text, \
+            f"Painel deve exibir o usuário autenticado. Texto: {dashboard.text}"
+        token = authenticated_driver.execute_script("return localStorage.getItem('token');")
+        assert token, "Token da sessão deve estar no localStorage"
+
+    def test_dashboard_sessao_rejeitada_refaz_login(self, driver, auth_state, valid_credentials):
+        """
+        Teste: Estado autenticado rejeitado pelo servidor.
+        Cenário: O cookie de sessão do snapshot deixa de ser válido.
+        Resultado esperado: Um novo login é feito automaticamente e o painel é exibido.
+        """
+        auth_state.open(driver)
+        # Cópia: o snapshot revogado não pode chegar aos outros testes do worker
+        state = copy.copy(auth_state)
+        state.snapshot = replace(
+            state.snapshot,
+            cookies=[dict(cookie, value="sessao-revogada") for cookie in state.snapshot.cookies],
+        )
+        logins = state.logins
+
+        state.open(driver)
+
+        assert state.logins == logins + 1, "Snapshot rejeitado deve ser refeito com um novo login"
+        dashboard = driver.find_element(*self.DASHBOARD_LOCATOR)
+        assert valid_credentials["email"] in dashboard.text, \
+            f"Painel deve exibir o usuário autenticado. Texto: {dashboard.text}"
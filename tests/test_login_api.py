@@ -0,0 +1,84 @@
+"""
+Testes de contrato da API de login, sem navegador.
+Cobre a mesma matriz de credenciais dos cenários negativos e de validação da
+interface, enviando as requisições diretamente ao endpoint de login.
+"""
+import json
+import pytest
+
+
+# Matriz de credenciais rejeitadas pela API: (email, senha)
+INVALID_CREDENTIALS = [
+    pytest.param("email_invalido@teste.com", "123456", id="email_invalido"),
+    pytest.param("test@universitypresence.com", "senha_incorreta_123", id="senha_incorreta"),
+    pytest.param("usuario_inexistente@teste.com", "senha_qualquer", id="credenciais_incorretas"),
+    pytest.param("email_sem_formato_valido", "123456", id="email_formato_invalido"),
+]
+
+MISSING_FIELDS = [
+    pytest.param("", "qualquer_senha", id="email_obrigatorio"),
+    pytest.param("teste@teste.com", "", id="senha_obrigatoria"),
+    pytest.param("", "", id="ambos_obrigatorios"),
+]
+
+
+@pytest.mark.api
+class TestLoginApi:
+    """Classe de testes de contrato da API de login."""
+
+    INVALID_CREDENTIALS_STATUS = 422
+
+    def _post_login(self, api_client, login_api_url, email, password):
+        """Envia a requisição de login e retorna (status, corpo JSON)."""
+        response = api_client.request(
+            "POST",
+            login_api_url,
+            body=json.dumps({"email": email, "password": password}),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        try:
+            payload = json.loads(response.data or b"{}")
+        except ValueError:
+            payload = None
+        return response.status, payload
+
+    def _assert_error_payload(self, payload):
+        """Verifica que a resposta de erro traz uma mensagem ou detalhes por campo."""
+        assert isinstance(payload, dict), f"Resposta de erro deve ser um objeto JSON. Recebido: {payload!r}"
+        assert payload.get("message") or payload.get("errors"), \
+            f"Resposta de erro deve conter 'message' ou 'errors'. Recebido: {payload!r}"
+
+    def test_login_sucesso_credenciais_validas(self, api_client, login_api_url, valid_credentials):
+        """
+        Teste: API aceita credenciais válidas.
+        Resultado esperado: status 200.
+        """
+        status, payload = self._post_login(
+            api_client, login_api_url, valid_credentials["email"], valid_credentials["password"]
+        )
+
+        assert status == 200, f"Login com credenciais válidas deve retornar 200. Status recebido: {status}, corpo: {payload!r}"
+
+    @pytest.mark.parametrize("email,password", INVALID_CREDENTIALS)
+    def test_login_falha_credenciais_invalidas(self, api_client, login_api_url, email, password):
+        """
+        Teste: API rejeita credenciais inválidas.
+        Resultado esperado: status 422 com mensagem de erro.
+        """
+        status, payload = self._post_login(api_client, login_api_url, email, password)
+
+        assert status == self.INVALID_CREDENTIALS_STATUS, \
+            f"API deve rejeitar o login com status {self.INVALID_CREDENTIALS_STATUS}. Status recebido: {status}"
+        self._assert_error_payload(payload)
+
+    @pytest.mark.parametrize("email,password", MISSING_FIELDS)
+    def test_validacao_campos_obrigatorios(self, api_client, login_api_url, email, password):
+        """
+        Teste: API valida campos obrigatórios.
+        Resultado esperado: status 422 com mensagem de erro.
+        """
+        status, payload = self._post_login(api_client, login_api_url, email, password)
+
+        assert status == self.INVALID_CREDENTIALS_STATUS, \
+            f"API deve rejeitar campos vazios com status {self.INVALID_CREDENTIALS_STATUS}. Status recebido: {status}"
+        self._assert_error_payload(payload)
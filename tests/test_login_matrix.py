@@ -0,0 +1,88 @@
+"""
+Matriz de credenciais data-driven lida de corpora CSV/JSONL (opção --corpus).
+Os casos são executados em lotes dentro de uma mesma sessão do navegador
+(recarrega a página, preenche, submete, verifica e repete), com o resultado de
+cada caso reportado individualmente como subteste.
+"""
+import pytest
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.pages import LoginPage
+from tests.support.corpus import ACCEPTED, CORPUS_INDEX_KEY, CorpusIndex
+from tests.support.network import assert_rejected, wait_for_api_response
+
+
+def pytest_generate_tests(metafunc):
+    """Parametriza o teste com um índice por lote do corpus (os casos são lidos só na execução)."""
+    if "corpus_batch" not in metafunc.fixturenames:
+        return
+    config = metafunc.config
+    paths = config.getoption("--corpus")
+    if not paths:
+        metafunc.parametrize("corpus_batch", [
+            pytest.param(None, marks=pytest.mark.skip(reason="Informe os arquivos de casos com --corpus"))
+        ])
+        return
+    if CORPUS_INDEX_KEY not in config.stash:
+        config.stash[CORPUS_INDEX_KEY] = CorpusIndex(paths, config.getoption("--corpus-batch-size"))
+    index = config.stash[CORPUS_INDEX_KEY]
+    metafunc.parametrize("corpus_batch", range(index.batches), ids=lambda batch: f"lote-{batch}")
+
+
+@pytest.mark.ui
+class TestLoginMatrix:
+    """Classe de testes da matriz de credenciais."""
+
+    LOGIN_API_PATTERN = "login"
+    INVALID_CREDENTIALS_STATUS = 422
+    # Falha quando a resposta de login não é observada (require_login_api_response no pytest.ini)
+    require_api_response = True
+
+    @pytest.fixture(autouse=True)
+    def _select_api_check(self, request):
+        """Aplica a opção `require_login_api_response` do pytest.ini."""
+        self.require_api_response = request.config.getini("require_login_api_response")
+
+    def _run_case(self, driver, base_url, page, case):
+        """Executa um caso: recarrega a página de login, preenche, submete e verifica o resultado."""
+        page.open(base_url)
+        initial_url = driver.current_url
+
+        page.fill_email(case["email"])
+        page.fill_password(case["password"])
+        page.submit()
+
+        if case["expected"] == ACCEPTED:
+            response = wait_for_api_response(driver, self.LOGIN_API_PATTERN, timeout=5)
+            assert response is None or response.status < 400, \
+                f"Login deveria ser aceito. Status recebido: {response and response.status}"
+            # O redirecionamento é disparado pela página depois da resposta do fetch
+            WebDriverWait(driver, 10).until(
+                EC.url_changes(initial_url), "Usuário deveria ser redirecionado após login válido"
+            )
+            # O próximo caso do lote começa sem sessão
+            driver.delete_all_cookies()
+            driver.execute_script("localStorage.clear(); sessionStorage.clear();")
+            return
+
+        # Validação no navegador (HTML5) dispensa aguardar a API
+        if any(state.is_invalid for state in page.field_states("email", "password")):
+            return
+        response = wait_for_api_response(driver, self.LOGIN_API_PATTERN, timeout=5)
+        assert_rejected(
+            response, self.INVALID_CREDENTIALS_STATUS, self.LOGIN_API_PATTERN, required=self.require_api_response
+        )
+        assert driver.current_url == initial_url, \
+            f"Usuário não deve ser redirecionado com credenciais rejeitadas. URL atual: {driver.current_url}"
+
+    def test_login_matriz_credenciais(self, request, driver, base_url, input_mode, subtests, corpus_batch):
+        """
+        Teste: Matriz de credenciais lida do corpus.
+        Cenário: Cada caso do lote é submetido na mesma sessão do navegador.
+        Resultado esperado: Casos "rejected" não autenticam; casos "accepted" redirecionam.
+        """
+        page = LoginPage(driver, input_mode=input_mode)
+        for case in request.config.stash[CORPUS_INDEX_KEY].batch(corpus_batch):
+            with subtests.test(msg=case["id"], email=case["email"]):
+                self._run_case(driver, base_url, page, case)
@@ -0,0 +1,326 @@
+"""
+Testes de unidade dos utilitários da suíte (tests/support e perf/).
+Não usam navegador nem servidor.
+"""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from perf.bench_suite import bootstrap_ratio_ci, compare
+from perf.load import LatencyHistogram
+from tests.support.auth import AuthSnapshot
+from tests.support.corpus import ACCEPTED, REJECTED, CorpusIndex, iter_cases
+from tests.support.fake_app import EndpointProfile, parse_profiles
+from tests.support.network import SCRIPT_TIMEOUT, ApiResponse, assert_rejected, script_timeout
+from tests.support.scheduling import pack_shards
+from tests.support.timing import METRICS, Budget
+from tests.support.waits import element_present, wait_for_any
+
+
+@pytest.mark.unit
+class TestCorpus:
+    """Leitura, remoção de duplicatas e lotes do corpus de credenciais."""
+
+    def _write(self, path, cases):
+        path.write_text("".join(json.dumps(case) + "\n" for case in cases), encoding="utf-8")
+        return path
+
+    def test_duplicatas_removidas_entre_arquivos(self, tmp_path):
+        self._write(tmp_path / "a.jsonl", [
+            {"email": "a@teste.com", "password": "1"},
+            {"email": "a@teste.com", "password": "1", "expected": "REJECTED"},
+            {"email": "a@teste.com", "password": "1", "expected": "accepted"},
+        ])
+        (tmp_path / "b.csv").write_text("email,password,expected\na@teste.com,1,\nb@teste.com,2,rejected\n", encoding="utf-8")
+
+        cases = list(iter_cases([tmp_path]))
+
+        assert [(case["email"], case["expected"]) for case in cases] == [
+            ("a@teste.com", REJECTED), ("a@teste.com", ACCEPTED), ("b@teste.com", REJECTED),
+        ]
+        assert [case["id"] for case in cases] == ["a.jsonl:1", "a.jsonl:3", "b.csv:2"]
+
+    def test_lotes_lidos_pelo_deslocamento(self, tmp_path):
+        corpus = self._write(tmp_path / "casos.jsonl", [{"email": f"{n}@teste.com", "password": "x"} for n in range(5)])
+        index = CorpusIndex([corpus], batch_size=2)
+        try:
+            assert (index.count, index.batches) == (5, 3)
+            assert [[case["email"] for case in index.batch(batch)] for batch in range(index.batches)] == [
+                ["0@teste.com", "1@teste.com"], ["2@teste.com", "3@teste.com"], ["4@teste.com"],
+            ]
+        finally:
+            index.close()
+
+    def test_close_remove_arquivo_temporario(self, tmp_path):
+        index = CorpusIndex([self._write(tmp_path / "casos.jsonl", [{"email": "a@teste.com"}])], batch_size=1)
+        spool_dir = os.path.dirname(index._spool)
+        index.close()
+        assert not os.path.exists(spool_dir)
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_tamanho_de_lote_invalido(self, tmp_path, batch_size):
+        with pytest.raises(ValueError):
+            CorpusIndex([tmp_path], batch_size=batch_size)
+
+
+@pytest.mark.unit
+class TestEndpointProfile:
+    """Perfis de latência e falhas do servidor local simulado."""
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("200", EndpointProfile(200.0, 0.0, 0.0)),
+        ("200:50", EndpointProfile(200.0, 50.0, 0.0)),
+        ("200:50:0.05", EndpointProfile(200.0, 50.0, 0.05)),
+    ])
+    def test_parse(self, spec, expected):
+        assert EndpointProfile.parse(spec) == expected
+
+    def test_parse_profiles_por_caminho(self):
+        profiles = parse_profiles(["/api/login=200:50:0.05", "/=10"])
+        assert profiles == {"/api/login": EndpointProfile(200.0, 50.0, 0.05), "/": EndpointProfile(10.0)}
+
+    def test_especificacao_invalida(self):
+        with pytest.raises(ValueError):
+            EndpointProfile.parse("rapido")
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Percentis do histograma logarítmico do teste de carga."""
+
+    def test_sem_amostras(self):
+        assert LatencyHistogram().percentile(50) is None
+
+    @pytest.mark.parametrize("p, exact", [(50, 500), (95, 950), (99, 990), (100, 1000)])
+    def test_percentis_com_resolucao_de_um_por_cento(self, p, exact):
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.add(value)
+        assert histogram.count == 1000
+        assert exact <= histogram.percentile(p) <= exact * LatencyHistogram.GROWTH ** 2
+
+    def test_memoria_proporcional_as_faixas(self):
+        histogram = LatencyHistogram()
+        for _ in range(10000):
+            histogram.add(42.0)
+        assert len(histogram.buckets) == 1
+        assert histogram.percentile(50) == pytest.approx(42.0, rel=0.01)
+
+
+@pytest.mark.unit
+class TestBudget:
+    """Orçamentos de desempenho de perf_budgets."""
+
+    def test_parse(self):
+        assert Budget.parse(" login.lcp_ms <= 2500 ") == Budget("login", "lcp_ms", 2500.0)
+
+    def test_todas_as_metricas_coletadas_sao_aceitas(self):
+        assert [Budget.parse(f"login.{metric} <= 1").metric for metric in METRICS] == list(METRICS)
+
+    @pytest.mark.parametrize("spec", [
+        "login.lcp <= 2500",        # Métrica inexistente (falta o sufixo _ms)
+        "login.lcp_ms < 2500",      # Operador
+        "lcp_ms <= 2500",           # Sem a página
+        "login.lcp_ms <= rapido",   # Valor
+    ])
+    def test_orcamento_invalido(self, spec):
+        with pytest.raises(pytest.UsageError):
+            Budget.parse(spec)
+
+
+@pytest.mark.unit
+class TestBenchComparison:
+    """Comparação de uma execução do bench_suite com a linha de base."""
+
+    BASELINE = [100.0, 102.0, 98.0, 101.0, 99.0, 100.5, 99.5, 100.0]
+
+    def test_intervalo_contem_a_razao_observada(self):
+        current = [value * 1.5 for value in self.BASELINE]
+        ratio, low, high = bootstrap_ratio_ci(self.BASELINE, current)
+        assert ratio == pytest.approx(1.5)
+        assert low <= ratio <= high
+
+    def test_mesma_semente_mesmo_intervalo(self):
+        current = [value * 1.1 for value in self.BASELINE]
+        assert bootstrap_ratio_ci(self.BASELINE, current, seed=3) == bootstrap_ratio_ci(self.BASELINE, current, seed=3)
+
+    @pytest.mark.parametrize("factor, verdict", [(1.5, "regressao"), (0.5, "melhoria"), (1.02, "estavel")])
+    def test_veredito(self, factor, verdict):
+        baseline = {"scenarios": {"navegacao": {"samples_ms": self.BASELINE}}}
+        current = {"scenarios": {
+            "navegacao": {"samples_ms": [value * factor for value in self.BASELINE]},
+            "novo_cenario": {"samples_ms": self.BASELINE},  # Sem linha de base: ignorado
+        }}
+        verdicts = compare(baseline, current, threshold=0.10, resamples=500)
+        assert list(verdicts) == ["navegacao"]
+        assert verdicts["navegacao"]["verdict"] == verdict
+
+
+@pytest.mark.unit
+class TestPackShards:
+    """Distribuição dos testes entre os workers pela duração estimada."""
+
+    class _Item:
+        def __init__(self, nodeid):
+            self.nodeid = nodeid
+
+    def _pack(self, estimates, workers):
+        items = [self._Item(nodeid) for nodeid in estimates]
+        return pack_shards(items, estimates, workers)
+
+    def test_grupo_com_menor_carga_recebe_o_proximo_teste(self):
+        shards, loads = self._pack({"a": 5.0, "b": 4.0, "c": 3.0, "d": 2.0, "e": 2.0}, workers=2)
+        assert shards == {"a": 0, "b": 1, "c": 1, "d": 0, "e": 0}
+        assert loads == [9.0, 7.0]
+
+    def test_mais_workers_que_testes(self):
+        shards, loads = self._pack({"a": 1.0}, workers=3)
+        assert shards == {"a": 0}
+        assert loads == [1.0, 0.0, 0.0]
+
+
+@pytest.mark.unit
+class TestAuthSnapshot:
+    """Parâmetros de cookie e expiração do snapshot autenticado."""
+
+    def _snapshot(self, cookies=(), expires_at=None):
+        return AuthSnapshot("http://localhost", list(cookies), {}, {}, expires_at=expires_at)
+
+    def test_cookie_params_mantem_apenas_campos_aceitos(self):
+        cookie = {
+            "name": "sid", "value": "abc", "domain": "localhost", "path": "/", "httpOnly": True,
+            "expires": 2000000000.5, "size": 6, "session": False, "sameParty": False,
+        }
+        assert self._snapshot([cookie]).cookie_params() == [{
+            "name": "sid", "value": "abc", "domain": "localhost", "path": "/", "httpOnly": True, "expires": 2000000000.5,
+        }]
+
+    @pytest.mark.parametrize("cookie", [
+        {"name": "sid", "value": "abc", "expires": -1, "session": True},
+        {"name": "sid", "value": "abc", "expires": 2000000000, "session": True},
+        {"name": "sid", "value": "abc", "expires": -1},
+    ])
+    def test_cookie_de_sessao_sem_expires(self, cookie):
+        assert self._snapshot([cookie]).cookie_params() == [{"name": "sid", "value": "abc"}]
+
+    def test_sem_expiracao_nunca_expira(self):
+        assert not self._snapshot().expired(margin=10 ** 9)
+
+    def test_expiracao(self):
+        assert self._snapshot(expires_at=time.time() - 1).expired()
+        assert not self._snapshot(expires_at=time.time() + 30).expired()
+        assert self._snapshot(expires_at=time.time() + 30).expired(margin=60)
+
+
+class _RecordingDriver:
+    """Driver falso que registra os tempos limite de script enviados."""
+
+    def __init__(self, result=None):
+        self.commands = []
+        self.result = result
+
+    def set_script_timeout(self, seconds):
+        self.commands.append(("set_script_timeout", seconds))
+
+    def execute_async_script(self, script, *args):
+        self.commands.append(("execute_async_script",))
+        return self.result
+
+
+@pytest.mark.unit
+class TestScriptTimeout:
+    """Tempo limite de scripts assíncronos em torno de uma espera."""
+
+    def test_dentro_do_padrao_nao_envia_comandos(self):
+        driver = _RecordingDriver()
+        with script_timeout(driver, SCRIPT_TIMEOUT):
+            pass
+        assert driver.commands == []
+
+    def test_wait_for_any_em_um_unico_comando(self):
+        driver = _RecordingDriver(result={"condition": "erro", "trigger": "initial", "elapsed": 0.5})
+        result = wait_for_any(driver, element_present(".erro", name="erro"), timeout=5)
+        assert result.condition == "erro"
+        assert driver.commands == [("execute_async_script",)]
+
+    def test_acima_do_padrao_volta_ao_padrao(self):
+        driver = _RecordingDriver()
+        with pytest.raises(RuntimeError):
+            with script_timeout(driver, SCRIPT_TIMEOUT + 30):
+                raise RuntimeError("falha dentro do bloco")
+        assert driver.commands == [("set_script_timeout", SCRIPT_TIMEOUT + 30), ("set_script_timeout", SCRIPT_TIMEOUT)]
+
+
+@pytest.mark.unit
+class TestAssertRejected:
+    """Verificação da resposta de login rejeitada."""
+
+    def _response(self, status):
+        return ApiResponse(url="/api/login", method="POST", status=status, elapsed_ms=1.0, settled=True)
+
+    def test_status_de_rejeicao(self):
+        assert_rejected(self._response(422), 422, "login")
+        with pytest.raises(AssertionError):
+            assert_rejected(self._response(200), 422, "login")
+
+    def test_sem_resposta_falha_a_menos_que_desativado(self):
+        with pytest.raises(AssertionError, match="Nenhuma resposta"):
+            assert_rejected(None, 422, "login")
+        assert_rejected(None, 422, "login", required=False)
+
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.unit
+class TestResourceMonitorSessionFinish:
+    """Busca de processos órfãos ao final da execução, depois do encerramento do pool."""
+
+    CONFTEST = """
+        import pytest
+
+        from tests.support import resources
+
+        def _record(event):
+            with open("eventos.txt", "a", encoding="utf-8") as f:
+                f.write(event + "\\n")
+
+        def pytest_configure(config):
+            resources.find_orphans = lambda profile_dirs: _record("busca de órfãos") or []
+            config.pluginmanager.register(resources.ResourceMonitorPlugin(resources.ResourceLimits()), "qa-resource-monitor")
+
+        @pytest.fixture(scope="session")
+        def driver_pool():
+            yield
+            _record("pool encerrado")
+    """
+
+    TESTS = """
+        def test_falha(driver_pool):
+            assert False
+
+        def test_nao_executado(driver_pool):
+            pass
+    """
+
+    @pytest.mark.parametrize("stop_option", ["--maxfail=1", "-x"])
+    def test_orfaos_buscados_depois_do_pool(self, tmp_path, stop_option):
+        (tmp_path / "conftest.py").write_text(textwrap.dedent(self.CONFTEST), encoding="utf-8")
+        (tmp_path / "test_interrompido.py").write_text(textwrap.dedent(self.TESTS), encoding="utf-8")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [_REPO_ROOT, os.environ.get("PYTHONPATH")])))
+
+        run = subprocess.run(
+            [sys.executable, "-m", "pytest", stop_option, "-p", "no:cacheprovider", "-p", "no:xdist",
+             "-o", "addopts=", "--rootdir", str(tmp_path), str(tmp_path)],
+            cwd=tmp_path, env=env, capture_output=True, text=True,
+        )
+
+        assert run.returncode == 1, run.stdout + run.stderr
+        assert "1 failed" in run.stdout
+        events = (tmp_path / "eventos.txt").read_text(encoding="utf-8").splitlines()
+        assert events == ["pool encerrado", "busca de órfãos"]